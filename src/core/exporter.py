@@ -11,7 +11,7 @@ from src.models.export_config import (
     ExportConfig, ExportFormat, LayoutMode, 
     SpriteSheetMeta, FrameRect, ResampleFilter
 )
-from src.utils.pngquant import compress_png, format_file_size
+from src.utils.pngquant import compress_png, compress_pngs_batch, format_file_size
 from src.core.sprite_webp_exporter import export_sprite_sheet_as_webp
 
 
@@ -286,12 +286,12 @@ class Exporter:
         # PNG压缩
         compress_info = None
         if config.pngquant_config.enabled and exported_files:
-            for file_path in exported_files:
-                success, original_size, compressed_size = compress_png(
-                    file_path,
-                    quality_min=config.pngquant_config.quality_min,
-                    quality_max=config.pngquant_config.quality_max
-                )
+            results = compress_pngs_batch(
+                exported_files,
+                quality_min=config.pngquant_config.quality_min,
+                quality_max=config.pngquant_config.quality_max
+            )
+            for success, original_size, compressed_size in results:
                 if success:
                     total_original += original_size
                     total_compressed += compressed_size
@@ -1,6 +1,10 @@
 """帧提取器模块"""
 from typing import List, Optional, Callable
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
 import cv2
 import numpy as np
 
@@ -67,6 +71,25 @@ class FrameExtractor:
         # 只有当实际位置接近目标位置时才认为支持定位
         return actual_pos >= 0 and abs(actual_pos - target_frame) <= 1
     
+    @staticmethod
+    def _build_timestamps(start_time: float, end_time: float, extract_fps: float) -> List[float]:
+        """生成提取时间戳列表"""
+        duration = end_time - start_time
+        
+        # 计算每帧的时间间隔
+        frame_interval = 1.0 / extract_fps
+        
+        # 生成时间戳列表
+        timestamps = []
+        # 计算总帧数
+        total_frames = int(duration * extract_fps) + 1
+        # 使用帧索引计算时间戳，避免浮点误差累积
+        for i in range(total_frames):
+            timestamp = start_time + i * frame_interval
+            if timestamp <= end_time:
+                timestamps.append(timestamp)
+        return timestamps
+    
     def extract_frames(
         self,
         video_path: str,
@@ -102,21 +125,7 @@ class FrameExtractor:
         try:
             # 计算需要提取的帧
             video_fps = video_info.fps
-            duration = end_time - start_time
-            
-            # 计算每帧的时间间隔
-            frame_interval = 1.0 / extract_fps
-            
-            # 生成时间戳列表
-            timestamps = []
-            # 计算总帧数
-            total_frames = int(duration * extract_fps) + 1
-            # 使用帧索引计算时间戳，避免浮点误差累积
-            for i in range(total_frames):
-                timestamp = start_time + i * frame_interval
-                if timestamp <= end_time:
-                    timestamps.append(timestamp)
-            
+            timestamps = self._build_timestamps(start_time, end_time, extract_fps)
             total_frames = len(timestamps)
 
             # Alpha 视频：用 moviepy FFMPEG_VideoReader 读帧，绝对可靠
@@ -206,6 +215,105 @@ class FrameExtractor:
         
         return frames
     
+    def extract_frames_parallel(
+        self,
+        video_path: str,
+        start_time: float,
+        end_time: float,
+        extract_fps: float,
+        video_info: VideoInfo,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        max_workers: Optional[int] = None
+    ) -> List[FrameData]:
+        """
+        多线程提取帧：每个线程持有独立的 VideoCapture 并行定位解码，结果按时间戳顺序收集
+        
+        Alpha 视频或不支持帧定位的视频回退到 extract_frames。参数与 extract_frames 相同，
+        max_workers 默认为 min(8, CPU 核数)。
+        """
+        if video_info.has_alpha:
+            return self.extract_frames(
+                video_path, start_time, end_time, extract_fps, video_info, progress_callback
+            )
+        
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise IOError(f"无法打开视频文件: {video_path}")
+        try:
+            seek_available = self._check_seek_available(cap, video_info.fps)
+            total_video_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        finally:
+            cap.release()
+        
+        if not seek_available:
+            return self.extract_frames(
+                video_path, start_time, end_time, extract_fps, video_info, progress_callback
+            )
+        
+        self._cancel_flag = False
+        video_fps = video_info.fps
+        timestamps = self._build_timestamps(start_time, end_time, extract_fps)
+        total_frames = len(timestamps)
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        
+        # cv2.VideoCapture 不是线程安全的，每个线程各开一个
+        local = threading.local()
+        captures: List[cv2.VideoCapture] = []
+        captures_lock = threading.Lock()
+        
+        def decode(timestamp: float) -> Optional[np.ndarray]:
+            cap = getattr(local, 'cap', None)
+            if cap is None:
+                cap = cv2.VideoCapture(video_path)
+                local.cap = cap
+                with captures_lock:
+                    captures.append(cap)
+            if self._cancel_flag:
+                return None
+            
+            # 计算对应的视频帧号（使用四舍五入避免浮点精度问题），并限制在有效范围内
+            frame_number = max(0, min(round(timestamp * video_fps), total_video_frames - 1))
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+            ret, frame = cap.read()
+            if not ret:
+                return None
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        
+        frames: List[FrameData] = []
+        # 限制在途任务数量，避免解码远超消费速度时占用过多内存
+        max_pending = workers * 2
+        pending = deque()
+        next_submit = 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="frame-extract") as executor:
+                for idx in range(total_frames):
+                    while next_submit < total_frames and len(pending) < max_pending:
+                        pending.append(executor.submit(decode, timestamps[next_submit]))
+                        next_submit += 1
+                    
+                    frame_rgb = pending.popleft().result()
+                    if self._cancel_flag:
+                        for future in pending:
+                            future.cancel()
+                        break
+                    
+                    if frame_rgb is not None:
+                        frames.append(FrameData(
+                            index=idx,  # 使用提取顺序索引，而非视频帧号
+                            timestamp=timestamps[idx],
+                            image=frame_rgb
+                        ))
+                    
+                    # 进度回调
+                    if progress_callback:
+                        progress = (idx + 1) / total_frames * 100
+                        progress_callback(idx + 1, total_frames, progress)
+        finally:
+            for cap in captures:
+                cap.release()
+        
+        return frames
+    
     def extract_single_frame(
         self,
         video_path: str,
@@ -482,29 +482,29 @@ class PoseDetector:
         
         result = image.copy()
         h, w = image.shape[:2]
-        
-        # 绘制连接线
+        n = len(pose_data.landmarks)
+        if n == 0:
+            return result
+        
+        # 一次性取出坐标和可见度，像素坐标与可见性用 numpy 批量计算
+        coords = np.array([(lm.x, lm.y) for lm in pose_data.landmarks], dtype=np.float64)
+        points = np.empty((n, 2), dtype=np.int32)
+        points[:, 0] = (coords[:, 0] * w).astype(np.int32)
+        points[:, 1] = (coords[:, 1] * h).astype(np.int32)
+        visible = pose_data.visibility_array > 0.5
+        
+        # 绘制连接线：筛选两端都可见的连接，一次 polylines 调用画完
         if draw_connections:
-            for start_idx, end_idx in PoseData.POSE_CONNECTIONS:
-                start_lm = pose_data.get_landmark(start_idx)
-                end_lm = pose_data.get_landmark(end_idx)
-                
-                if start_lm and end_lm:
-                    if start_lm.visibility > 0.5 and end_lm.visibility > 0.5:
-                        start_point = start_lm.to_pixel(w, h)
-                        end_point = end_lm.to_pixel(w, h)
-                        
-                        # 使用cv2绘制
-                        import cv2
-                        cv2.line(result, start_point, end_point, connection_color, thickness)
+            connections = np.array(PoseData.POSE_CONNECTIONS, dtype=np.intp)
+            connections = connections[(connections < n).all(axis=1)]
+            connections = connections[visible[connections[:, 0]] & visible[connections[:, 1]]]
+            if len(connections):
+                cv2.polylines(result, list(points[connections]), False, connection_color, thickness)
         
         # 绘制关键点
         if draw_landmarks:
-            import cv2
-            for lm in pose_data.landmarks:
-                if lm.visibility > 0.5:
-                    point = lm.to_pixel(w, h)
-                    cv2.circle(result, point, thickness + 2, landmark_color, -1)
+            for x, y in points[visible].tolist():
+                cv2.circle(result, (x, y), thickness + 2, landmark_color, -1)
         
         return result
     
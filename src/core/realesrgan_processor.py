@@ -1,7 +1,8 @@
 """Real-ESRGAN 图像增强模块"""
-from typing import Optional, Callable, Dict
+from typing import Optional, Callable, Dict, List
 from enum import Enum
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import cv2
 import subprocess
@@ -56,6 +57,8 @@ MODEL_INFO: Dict[str, dict] = {
 class RealESRGANProcessor:
     """Real-ESRGAN 图像增强处理器"""
     
+    BATCH_SIZE = 8  # batch_process 每次调用可执行文件处理的图像数
+    
     def __init__(self, progress_callback: Optional[Callable[[str], None]] = None):
         self._progress_callback = progress_callback
         self._executable_path = self._find_executable()
@@ -146,86 +149,170 @@ class RealESRGANProcessor:
             
             # 保存输入图像
             input_path = temp_dir / "input.png"
-            if len(image.shape) == 3 and image.shape[2] == 4:
-                # RGBA图像
-                cv2.imwrite(str(input_path), cv2.cvtColor(image, cv2.COLOR_RGBA2BGRA))
-            else:
-                # RGB图像
-                cv2.imwrite(str(input_path), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+            self._write_input(input_path, image)
             
             # 输出路径
             output_path = temp_dir / "output.png"
             
-            # 构建命令
-            cmd = [
-                str(self._executable_path),
-                "-i", str(input_path),
-                "-o", str(output_path),
-                "-n", model_name
-            ]
+            self._report_progress(f"开始处理图像，使用模型: {model_info['display_name']}")
+            if not self._run(input_path, output_path, model_name, tile):
+                return None
+            
+            # 读取输出图像
+            if not output_path.exists():
+                self._report_progress("未生成输出图像")
+                return None
             
-            # 添加分块参数
-            if tile > 0:
-                cmd.extend(["-t", str(tile)])
+            output_image = self._read_output(output_path)
+            if output_image is None:
+                self._report_progress("无法读取输出图像")
+                return None
             
-            try:
-                self._report_progress(f"开始处理图像，使用模型: {model_info['display_name']}")
+            self._report_progress("图像处理完成")
+            return output_image
+    
+    def process_images(
+        self,
+        images: List[np.ndarray],
+        model_name: str = "realesrgan-x4plus",
+        tile: int = 0
+    ) -> List[Optional[np.ndarray]]:
+        """
+        一次调用处理多张图像
+        
+        realesrgan-ncnn-vulkan 支持以目录为输入，整批只启动一次进程、加载一次模型，
+        省去逐张处理时重复的进程启动和显存初始化开销。
+        
+        Args:
+            images: 输入图像列表，每张为 (H, W, 3) 或 (H, W, 4)
+            model_name: 模型名称
+            tile: 分块大小，0表示不使用分块
+            
+        Returns:
+            与 images 一一对应的增强结果，失败的位置为None
+        """
+        if not images:
+            return []
+        if not self.is_available():
+            self._report_progress("Real-ESRGAN 不可用，请检查文件是否完整")
+            return [None] * len(images)
+        
+        # 检查模型是否可用
+        models = self.get_available_models()
+        model_info = next((m for m in models if m["name"] == model_name), None)
+        if not model_info or not model_info["installed"]:
+            self._report_progress(f"模型 {model_name} 未安装")
+            return [None] * len(images)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            input_dir = temp_dir / "input"
+            output_dir = temp_dir / "output"
+            input_dir.mkdir()
+            output_dir.mkdir()
+            
+            names = [f"{i:05d}.png" for i in range(len(images))]
+            # PNG 编解码在 OpenCV 内部释放 GIL，多张图像的写入/读取并行进行
+            workers = min(os.cpu_count() or 1, len(images))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="realesrgan-io") as executor:
+                list(executor.map(self._write_input, [input_dir / name for name in names], images))
                 
-                # 执行命令，实时读取输出
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    cwd=str(self._executable_path.parent)
+                self._report_progress(
+                    f"开始处理 {len(images)} 张图像，使用模型: {model_info['display_name']}"
                 )
+                if not self._run(input_dir, output_dir, model_name, tile, ["-f", "png"]):
+                    return [None] * len(images)
                 
-                # 实时读取输出
-                while True:
-                    if self._cancel_flag:
-                        process.terminate()
-                        self._report_progress("处理已取消")
-                        return None
-                    
-                    output = process.stdout.readline()
-                    if output == '' and process.poll() is not None:
-                        break
-                    if output:
-                        # 解析输出，提取进度信息
-                        output = output.strip()
-                        self._report_progress(f"处理中: {output}")
-                
-                # 检查返回码
-                if process.returncode != 0:
-                    self._report_progress(f"处理失败，返回码: {process.returncode}")
-                    return None
-                
-                # 读取输出图像
-                if not output_path.exists():
-                    self._report_progress("未生成输出图像")
-                    return None
-                
-                # 读取图像
-                output_image = cv2.imread(str(output_path), cv2.IMREAD_UNCHANGED)
-                
-                if output_image is None:
-                    self._report_progress("无法读取输出图像")
-                    return None
-                
-                # 转换颜色空间
-                if output_image.shape[2] == 4:
-                    # BGRA转RGBA
-                    output_image = cv2.cvtColor(output_image, cv2.COLOR_BGRA2RGBA)
-                else:
-                    # BGR转RGB
-                    output_image = cv2.cvtColor(output_image, cv2.COLOR_BGR2RGB)
-                
-                self._report_progress("图像处理完成")
-                return output_image
+                output_paths = [output_dir / name for name in names]
+                results = list(executor.map(
+                    lambda path: self._read_output(path) if path.exists() else None,
+                    output_paths
+                ))
+            
+            self._report_progress("图像处理完成")
+            return results
+    
+    @staticmethod
+    def _write_input(path: Path, image: np.ndarray):
+        """将 RGB/RGBA 图像保存为 realesrgan 的输入文件"""
+        if len(image.shape) == 3 and image.shape[2] == 4:
+            # RGBA图像
+            cv2.imwrite(str(path), cv2.cvtColor(image, cv2.COLOR_RGBA2BGRA))
+        else:
+            # RGB图像
+            cv2.imwrite(str(path), cv2.cvtColor(image, cv2.COLOR_RGB2BGR))
+    
+    @staticmethod
+    def _read_output(path: Path) -> Optional[np.ndarray]:
+        """读取 realesrgan 输出文件并转换为 RGB/RGBA"""
+        output_image = cv2.imread(str(path), cv2.IMREAD_UNCHANGED)
+        if output_image is None:
+            return None
+        
+        # 转换颜色空间
+        if output_image.shape[2] == 4:
+            # BGRA转RGBA
+            return cv2.cvtColor(output_image, cv2.COLOR_BGRA2RGBA)
+        # BGR转RGB
+        return cv2.cvtColor(output_image, cv2.COLOR_BGR2RGB)
+    
+    def _run(
+        self,
+        input_path: Path,
+        output_path: Path,
+        model_name: str,
+        tile: int,
+        extra_args: Optional[List[str]] = None
+    ) -> bool:
+        """运行 realesrgan-ncnn-vulkan，实时转发输出，返回是否成功"""
+        # 构建命令
+        cmd = [
+            str(self._executable_path),
+            "-i", str(input_path),
+            "-o", str(output_path),
+            "-n", model_name
+        ]
+        
+        # 添加分块参数
+        if tile > 0:
+            cmd.extend(["-t", str(tile)])
+        if extra_args:
+            cmd.extend(extra_args)
+        
+        try:
+            # 执行命令，实时读取输出
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                cwd=str(self._executable_path.parent)
+            )
+            
+            # 实时读取输出
+            while True:
+                if self._cancel_flag:
+                    process.terminate()
+                    self._report_progress("处理已取消")
+                    return False
                 
-            except Exception as e:
-                self._report_progress(f"处理错误: {str(e)}")
-                return None
+                output = process.stdout.readline()
+                if output == '' and process.poll() is not None:
+                    break
+                if output:
+                    # 解析输出，提取进度信息
+                    output = output.strip()
+                    self._report_progress(f"处理中: {output}")
+            
+            # 检查返回码
+            if process.returncode != 0:
+                self._report_progress(f"处理失败，返回码: {process.returncode}")
+                return False
+            return True
+            
+        except Exception as e:
+            self._report_progress(f"处理错误: {str(e)}")
+            return False
     
     def batch_process(self,
                      images: list,
@@ -248,16 +335,18 @@ class RealESRGANProcessor:
         results = []
         total = len(images)
         
-        for i, image in enumerate(images):
+        # 按块调用 process_images，每块只启动一次进程、加载一次模型
+        for start in range(0, total, self.BATCH_SIZE):
             if self._cancel_flag:
                 break
             
-            result = self.process_image(image, model_name, tile)
-            results.append(result)
+            chunk = images[start:start + self.BATCH_SIZE]
+            results.extend(self.process_images(chunk, model_name, tile))
             
             if progress_callback:
-                progress = (i + 1) / total * 100
-                progress_callback(i + 1, total, progress)
+                done = start + len(chunk)
+                progress = done / total * 100
+                progress_callback(done, total, progress)
         
         return results
     
@@ -1,5 +1,5 @@
 """视频处理核心模块"""
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 import cv2
 import numpy as np
@@ -235,32 +235,66 @@ class VideoProcessor:
         
         self._use_sequential_mode = actual_pos < 0 or abs(actual_pos - target_frame) > 1
 
-    def get_frame_at(self, timestamp: float) -> Optional[np.ndarray]:
-        """获取指定时间戳的帧"""
+    def get_frame_at(self, timestamp: float, copy: bool = True) -> Optional[np.ndarray]:
+        """获取指定时间戳的帧（RGB/RGBA）"""
         if not self.is_loaded or self._video_info is None:
             return None
         
         # 计算帧号
         frame_number = int(timestamp * self._video_info.fps)
-        return self.get_frame_by_index(frame_number)
+        return self.get_frame_by_index(frame_number, copy)
     
-    def get_frame_by_index(self, frame_index: int) -> Optional[np.ndarray]:
-        """获取指定索引的帧"""
-        if not self.is_loaded or self._video_info is None:
+    def get_frame_by_index(self, frame_index: int, copy: bool = True) -> Optional[np.ndarray]:
+        """获取指定索引的帧（RGB/RGBA）
+        
+        copy=False 且缓存帧本身就是 RGB 时直接返回缓存中的只读数组。
+        """
+        frame = self._get_native_frame(frame_index)
+        if frame is None:
             return None
+        if self._native_is_bgr:
+            # cvtColor 生成新数组，无需再复制
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return frame.copy() if copy else frame
+    
+    def get_display_frame_at(self, timestamp: float) -> Tuple[Optional[np.ndarray], bool, bool]:
+        """获取用于显示的帧，返回 (缓存中的只读帧, 是否为 BGR 通道顺序, 是否命中缓存)
+        
+        OpenCV 解码的帧以 BGR 原样缓存，显示时用 QImage.Format_BGR888 直接构造，
+        省去逐帧的通道转换；Alpha 视频经 moviepy 解码，为 RGB/RGBA。
+        """
+        if not self.is_loaded or self._video_info is None:
+            return None, False, False
+        frame_number = int(timestamp * self._video_info.fps)
+        frame, cache_hit = self._lookup_native_frame(frame_number)
+        return frame, self._native_is_bgr, cache_hit
+    
+    @property
+    def _native_is_bgr(self) -> bool:
+        """缓存中的帧是否为 OpenCV 的 BGR 顺序（非 Alpha 视频）"""
+        return self._video_info is not None and not self._video_info.has_alpha
+    
+    def _get_native_frame(self, frame_index: int) -> Optional[np.ndarray]:
+        """获取解码器原始通道顺序的缓存帧（只读）"""
+        return self._lookup_native_frame(frame_index)[0]
+    
+    def _lookup_native_frame(self, frame_index: int) -> Tuple[Optional[np.ndarray], bool]:
+        """同 _get_native_frame，额外返回是否命中缓存（查询缓存只加一次锁）"""
+        if not self.is_loaded or self._video_info is None:
+            return None, False
         
         # 边界检查
         if frame_index < 0 or frame_index >= self._video_info.frame_count:
-            return None
+            return None, False
         
         # 检查缓存
         with self._lock:
-            if frame_index in self._frame_cache:
+            frame = self._frame_cache.pop(frame_index, None)
+            if frame is not None:
                 # 更新访问时间（通过重新插入来实现LRU）
-                frame = self._frame_cache.pop(frame_index)
                 self._frame_cache[frame_index] = frame
                 self._last_accessed_frame = frame_index
-                return frame.copy()
+                return frame, True
         
         # Alpha 视频优先用 moviepy ffmpeg reader
         if self._video_info.has_alpha:
@@ -274,10 +308,10 @@ class VideoProcessor:
         
         if frame is not None:
             # 添加到缓存
-            self._add_to_cache(frame_index, frame)
+            frame = self._add_to_cache(frame_index, frame)
             self._last_accessed_frame = frame_index
-            return frame.copy()
-        return None
+            return frame, False
+        return None, False
 
     def _get_frame_seek(self, frame_index: int) -> Optional[np.ndarray]:
         """使用帧定位获取帧（适用于支持随机访问的普通视频）"""
@@ -286,7 +320,7 @@ class VideoProcessor:
                 self._cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
                 ret, frame = self._cap.read()
                 if ret:
-                    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    return frame
             except Exception as e:
                 print(f"Error in _get_frame_seek: {e}")
             return None
@@ -299,7 +333,7 @@ class VideoProcessor:
                 if frame_index == self._last_accessed_frame + 1:
                     ret, frame = self._cap.read()
                     if ret:
-                        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        return frame
                     return None
 
                 # 如果请求的是已经缓存的帧附近，从缓存恢复
@@ -322,19 +356,23 @@ class VideoProcessor:
 
                 ret, frame = self._cap.read()
                 if ret:
-                    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    return frame
             except Exception as e:
                 print(f"Error in _get_frame_sequential: {e}")
             return None
 
-    def _add_to_cache(self, frame_index: int, frame: np.ndarray):
-        """添加帧到缓存"""
+    def _add_to_cache(self, frame_index: int, frame: np.ndarray) -> np.ndarray:
+        """添加帧到缓存，返回缓存中的只读帧
+        
+        传入的帧须为新解码、无其他引用的数组，这里直接接管而不再复制。
+        """
+        frame.setflags(write=False)
         with self._lock:
             # 添加或更新帧到缓存
             if frame_index in self._frame_cache:
                 # 如果已存在，先删除旧的（为了更新位置，实现LRU）
                 del self._frame_cache[frame_index]
-            self._frame_cache[frame_index] = frame.copy()
+            self._frame_cache[frame_index] = frame
             
             # 限制缓存大小
             if len(self._frame_cache) > self._cache_size:
@@ -342,6 +380,7 @@ class VideoProcessor:
                 # 注意：Python 3.7+的字典会保持插入顺序
                 oldest_frame = next(iter(self._frame_cache))
                 del self._frame_cache[oldest_frame]
+        return frame
 
     def get_frame_count_in_range(self, start_time: float, end_time: float, fps: float) -> int:
         """计算时间范围内按指定帧率的帧数"""
@@ -420,7 +459,7 @@ class VideoProcessor:
                             continue
                     # 预加载帧，添加异常捕获
                     try:
-                        self.get_frame_by_index(frame_index)
+                        self._get_native_frame(frame_index)
                     except Exception as e:
                         print(f"Error in preload: {e}")
                         # 短暂休眠，避免连续错误
@@ -1,7 +1,8 @@
 """姿势数据模型"""
 from typing import List, Optional, Tuple, ClassVar
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 import math
+import numpy as np
 
 
 class Landmark(BaseModel):
@@ -101,6 +102,20 @@ class PoseData(BaseModel):
     # 类变量引用模块级常量
     POSE_CONNECTIONS: ClassVar[List[Tuple[int, int]]] = POSE_CONNECTIONS
     
+    # 可见度数组缓存（不参与序列化）
+    _visibility_array: Optional[np.ndarray] = PrivateAttr(default=None)
+    
+    @property
+    def visibility_array(self) -> np.ndarray:
+        """各关键点的可见度数组，首次访问时构建并缓存"""
+        if self._visibility_array is None or len(self._visibility_array) != len(self.landmarks):
+            self._visibility_array = np.fromiter(
+                (lm.visibility for lm in self.landmarks),
+                dtype=np.float64,
+                count=len(self.landmarks)
+            )
+        return self._visibility_array
+    
     def get_landmark(self, index: int) -> Optional[Landmark]:
         """获取指定索引的关键点"""
         if 0 <= index < len(self.landmarks):
@@ -1078,6 +1078,7 @@ class MainWindow(QMainWindow):
         # 时间轴变化
         self.timeline.range_changed.connect(self._on_time_range_changed)
         self.timeline.seek_requested.connect(self.video_player.seek)
+        self.timeline.preview_requested.connect(self.video_player.preview_position)
         self.video_player.position_changed.connect(self.timeline.set_current_position)
         self.range_play_check.toggled.connect(self._on_range_play_toggled)
         self.fps_spin.valueChanged.connect(self._on_fps_changed)
@@ -1323,7 +1324,7 @@ class MainWindow(QMainWindow):
         )
         
         self._background_worker.progress.connect(self._on_bg_progress)
-        self._background_worker.frame_processed.connect(self._on_frame_processed)
+        self._background_worker.frames_processed_batch.connect(self._on_frames_processed)
         self._background_worker.status_changed.connect(self._on_bg_status)
         self._background_worker.finished.connect(self._on_bg_finished)
         self._background_worker.error.connect(self._on_bg_error)
@@ -1382,7 +1383,7 @@ class MainWindow(QMainWindow):
         self._pose_worker = PoseWorker(frames=frames, mode=detect_mode)
         
         self._pose_worker.progress.connect(self._on_pose_progress)
-        self._pose_worker.pose_detected.connect(self._on_pose_detected)
+        self._pose_worker.frames_processed_batch.connect(self._on_poses_detected)
         self._pose_worker.finished.connect(self._on_pose_finished)
         self._pose_worker.error.connect(self._on_pose_error)
         
@@ -1630,7 +1631,7 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'enhance_worker') and self.enhance_worker:
             try:
                 self.enhance_worker.progress.disconnect(self._on_enhance_progress)
-                self.enhance_worker.frame_processed.disconnect(self._on_enhance_frame_processed)
+                self.enhance_worker.frames_processed_batch.disconnect(self._on_enhance_frames_processed)
                 self.enhance_worker.status_changed.disconnect(self.status_label.setText)
                 self.enhance_worker.finished.disconnect(self._on_enhance_finished)
                 self.enhance_worker.error.disconnect(self._on_enhance_error)
@@ -1647,7 +1648,7 @@ class MainWindow(QMainWindow):
         
         # 连接信号
         self.enhance_worker.progress.connect(self._on_enhance_progress)
-        self.enhance_worker.frame_processed.connect(self._on_enhance_frame_processed)
+        self.enhance_worker.frames_processed_batch.connect(self._on_enhance_frames_processed)
         self.enhance_worker.status_changed.connect(self.status_label.setText)
         self.enhance_worker.finished.connect(self._on_enhance_finished)
         self.enhance_worker.error.connect(self._on_enhance_error)
@@ -1671,11 +1672,12 @@ class MainWindow(QMainWindow):
         # 详细的处理信息会通过 status_changed 信号更新
         QApplication.processEvents()
     
-    def _on_enhance_frame_processed(self, frame_index: int, enhanced_image: np.ndarray):
-        """单帧增强完成"""
-        # 更新帧数据
-        self._frame_manager.update_frame_image(frame_index, enhanced_image, processed=True)
-        self.frame_preview.update_frame(frame_index, enhanced_image)
+    def _on_enhance_frames_processed(self, batch: list):
+        """一批帧增强完成"""
+        for frame_index, enhanced_image in batch:
+            # 更新帧数据
+            self._frame_manager.update_frame_image(frame_index, enhanced_image, processed=True)
+            self.frame_preview.update_frame(frame_index, enhanced_image)
         QApplication.processEvents()
     
     def _on_enhance_finished(self):
@@ -2034,12 +2036,13 @@ class MainWindow(QMainWindow):
     def _on_bg_status(self, status: str):
         self.status_label.setText(status)
     
-    def _on_frame_processed(self, frame_index: int, processed_image):
-        # 更新帧数据
-        self._frame_manager.update_frame_image(frame_index, processed_image, processed=True)
-        
-        # 更新预览
-        self.frame_preview.update_frame(frame_index, processed_image)
+    def _on_frames_processed(self, batch: list):
+        for frame_index, processed_image in batch:
+            # 更新帧数据
+            self._frame_manager.update_frame_image(frame_index, processed_image, processed=True)
+            
+            # 更新预览
+            self.frame_preview.update_frame(frame_index, processed_image)
     
     def _on_bg_finished(self):
         self.progress_bar.setVisible(False)
@@ -2371,9 +2374,11 @@ class MainWindow(QMainWindow):
         mode_text = "轮廓" if detect_mode == "contour" else "姿势"
         self.status_label.setText(f"正在检测{mode_text}... {current}/{total}")
     
-    def _on_pose_detected(self, frame_index: int, data):
-        if data:
-            detect_mode = self.detect_mode_combo.currentData()
+    def _on_poses_detected(self, batch: list):
+        detect_mode = self.detect_mode_combo.currentData()
+        for frame_index, data in batch:
+            if not data:
+                continue
             if detect_mode == "contour":
                 self._frame_manager.add_contour(data)
             elif detect_mode == "image":
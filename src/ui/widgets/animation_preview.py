@@ -8,10 +8,11 @@ from PySide6.QtWidgets import (
     QProgressBar, QMessageBox
 )
 from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtGui import QPixmap
 import numpy as np
 
 from src.utils.crossfade import apply_loop_transition
+from src.utils.image_utils import numpy_to_qpixmap
 
 
 class AnimationPreview(QWidget):
@@ -262,26 +263,8 @@ class AnimationPreview(QWidget):
     
     def _numpy_to_pixmap(self, array: np.ndarray) -> QPixmap:
         """将 numpy 数组转换为 QPixmap，保留透明通道"""
-        if array is None:
-            return QPixmap()
-        
-        # 确保数组是 C-contiguous（QImage 需要）
-        if not array.flags['C_CONTIGUOUS']:
-            array = np.ascontiguousarray(array)
-        
-        h, w = array.shape[:2]
-        
-        if len(array.shape) == 2:
-            qimg = QImage(array.data, w, h, w, QImage.Format_Grayscale8)
-        elif len(array.shape) == 3 and array.shape[2] == 3:
-            qimg = QImage(array.data, w, h, w * 3, QImage.Format_RGB888)
-        elif len(array.shape) == 3 and array.shape[2] == 4:
-            # RGBA 图 - 保留透明通道
-            qimg = QImage(array.data, w, h, w * 4, QImage.Format_RGBA8888)
-        else:
-            return QPixmap()
-        
-        return QPixmap.fromImage(qimg.copy())
+        # 零拷贝包装后只在 QPixmap.fromImage 中复制一次
+        return numpy_to_qpixmap(array)
     
     def clear(self):
         """清空帧"""
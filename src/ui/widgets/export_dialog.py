@@ -5,25 +5,40 @@ from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QLabel,
     QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
     QPushButton, QFileDialog, QLineEdit, QRadioButton,
-    QButtonGroup, QTabWidget, QWidget, QMessageBox, QSlider
+    QButtonGroup, QTabWidget, QWidget, QMessageBox, QSlider, QAbstractButton
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker, QTimer
 
 from src.models.export_config import ExportConfig, ExportFormat, LayoutMode, ResampleFilter
 from src.utils.config import config
 from src.utils.pngquant import is_pngquant_available
 
 
+# 下拉框数据值 -> 缩放算法枚举
+_FILTER_BY_VALUE = {f.value: f for f in ResampleFilter}
+
+
 class ExportDialog(QDialog):
     """导出配置对话框"""
     
+    # stateChanged 传入的是 int，缓存 Checked 的整数值避免每次查找枚举
+    _CHECKED = Qt.CheckState.Checked.value
+    
+    # 各选项卡共用的标签文本
+    _LBL_WIDTH = "宽:"
+    _LBL_HEIGHT = "高:"
+    _LBL_ALGO = "算法:"
+    
     def __init__(self, frame_count: int = 0, parent=None):
         super().__init__(parent)
         self.frame_count = frame_count
-        self._config = ExportConfig()
+        self._config = ExportConfig()  # 上次生成的配置缓存
+        self._config_dirty = True  # 控件变化后需重新生成配置
         self._aspect_ratio = 1.0  # 宽高比
         self._lock_aspect_ratio = True  # 锁定比例
-        self._updating_size = False  # 防止递归更新
+        
+        # 关闭对话框时记录导出目录（落盘的防抖由 config 负责）
+        self.finished.connect(self._save_export_dir)
         
         self.setWindowTitle("导出设置")
         self.setMinimumWidth(400)
@@ -52,6 +67,23 @@ class ExportDialog(QDialog):
         # godot_tab = self._create_godot_tab()
         # self.tab_widget.addTab(godot_tab, "Godot")
         
+        # 导出选项（各选项卡共用的缩放算法）
+        options_group = QGroupBox("导出选项")
+        options_layout = QHBoxLayout(options_group)
+        
+        options_layout.addWidget(QLabel(self._LBL_ALGO))
+        self.resample_combo = QComboBox()
+        self.resample_combo.addItem("📍 最近邻 (像素风格)", ResampleFilter.NEAREST.value)
+        self.resample_combo.addItem("📊 盒式滤波", ResampleFilter.BOX.value)
+        self.resample_combo.addItem("🌀 双线性 (平滑)", ResampleFilter.BILINEAR.value)
+        self.resample_combo.addItem("🔊 Hamming", ResampleFilter.HAMMING.value)
+        self.resample_combo.addItem("✨ 双三次 (高质量)", ResampleFilter.BICUBIC.value)
+        self.resample_combo.addItem("🌟 Lanczos (最高质量)", ResampleFilter.LANCZOS.value)
+        self.resample_combo.setCurrentIndex(5)  # 默认Lanczos
+        options_layout.addWidget(self.resample_combo, 1)
+        
+        layout.addWidget(options_group)
+        
         # 输出路径
         path_group = QGroupBox("输出设置")
         path_layout = QVBoxLayout(path_group)
@@ -70,10 +102,8 @@ class ExportDialog(QDialog):
         dir_layout.addWidget(QLabel("保存到:"))
         self.path_edit = QLineEdit()
         self.path_edit.setReadOnly(True)
-        # 加载上次导出路径
-        last_dir = config.last_export_dir
-        if last_dir:
-            self.path_edit.setText(last_dir)
+        # 加载上次导出路径（延迟到对话框显示后，避免阻塞首次绘制）
+        QTimer.singleShot(0, self._load_last_export_dir)
         dir_layout.addWidget(self.path_edit, 1)
         self.browse_btn = QPushButton("浏览...")
         self.browse_btn.clicked.connect(self._browse_path)
@@ -175,6 +205,24 @@ class ExportDialog(QDialog):
         btn_layout.addWidget(self.export_btn)
         
         layout.addLayout(btn_layout)
+        
+        self._connect_dirty_signals()
+    
+    def _connect_dirty_signals(self):
+        """任意选项变化时标记配置需要重新生成"""
+        mark = self._mark_config_dirty
+        self.tab_widget.currentChanged.connect(mark)
+        for w in self.findChildren(QAbstractButton):
+            w.toggled.connect(mark)
+        for w in self.findChildren(QSpinBox) + self.findChildren(QDoubleSpinBox) + self.findChildren(QSlider):
+            w.valueChanged.connect(mark)
+        for w in self.findChildren(QLineEdit):
+            w.textChanged.connect(mark)
+        for w in self.findChildren(QComboBox):
+            w.currentIndexChanged.connect(mark)
+    
+    def _mark_config_dirty(self, *args):
+        self._config_dirty = True
     
     def _create_sprite_tab(self) -> QWidget:
         """创建精灵图选项卡"""
@@ -223,7 +271,7 @@ class ExportDialog(QDialog):
         size_layout.addWidget(self.original_size_check)
         
         size_input_layout = QHBoxLayout()
-        size_input_layout.addWidget(QLabel("宽:"))
+        size_input_layout.addWidget(QLabel(self._LBL_WIDTH))
         self.frame_width_spin = QSpinBox()
         self.frame_width_spin.setRange(config.FRAME_SIZE_MIN, config.FRAME_SIZE_MAX)
         self.frame_width_spin.setValue(config.FRAME_WIDTH_DEFAULT)
@@ -231,7 +279,7 @@ class ExportDialog(QDialog):
         self.frame_width_spin.valueChanged.connect(self._on_sprite_width_changed)
         size_input_layout.addWidget(self.frame_width_spin)
         
-        size_input_layout.addWidget(QLabel("高:"))
+        size_input_layout.addWidget(QLabel(self._LBL_HEIGHT))
         self.frame_height_spin = QSpinBox()
         self.frame_height_spin.setRange(config.FRAME_SIZE_MIN, config.FRAME_SIZE_MAX)
         self.frame_height_spin.setValue(config.FRAME_HEIGHT_DEFAULT)
@@ -248,23 +296,6 @@ class ExportDialog(QDialog):
         
         layout.addWidget(size_group)
         
-        # 缩放算法选择
-        resample_group = QGroupBox("缩放算法")
-        resample_layout = QHBoxLayout(resample_group)
-        
-        resample_layout.addWidget(QLabel("算法:"))
-        self.resample_combo = QComboBox()
-        self.resample_combo.addItem("📍 最近邻 (像素风格)", ResampleFilter.NEAREST.value)
-        self.resample_combo.addItem("📊 盒式滤波", ResampleFilter.BOX.value)
-        self.resample_combo.addItem("🌀 双线性 (平滑)", ResampleFilter.BILINEAR.value)
-        self.resample_combo.addItem("🔊 Hamming", ResampleFilter.HAMMING.value)
-        self.resample_combo.addItem("✨ 双三次 (高质量)", ResampleFilter.BICUBIC.value)
-        self.resample_combo.addItem("🌟 Lanczos (最高质量)", ResampleFilter.LANCZOS.value)
-        self.resample_combo.setCurrentIndex(5)  # 默认Lanczos
-        resample_layout.addWidget(self.resample_combo, 1)
-        
-        layout.addWidget(resample_group)
-        
         # 其他选项
         self.padding_spin = QSpinBox()
         self.padding_spin.setRange(0, config.PADDING_MAX)
@@ -326,7 +357,7 @@ class ExportDialog(QDialog):
         size_layout.addWidget(self.gif_original_size_check)
         
         gif_size_input_layout = QHBoxLayout()
-        gif_size_input_layout.addWidget(QLabel("宽:"))
+        gif_size_input_layout.addWidget(QLabel(self._LBL_WIDTH))
         self.gif_width_spin = QSpinBox()
         self.gif_width_spin.setRange(config.FRAME_SIZE_MIN, config.GIF_SIZE_MAX)
         self.gif_width_spin.setValue(config.GIF_WIDTH_DEFAULT)
@@ -334,7 +365,7 @@ class ExportDialog(QDialog):
         self.gif_width_spin.valueChanged.connect(self._on_gif_width_changed)
         gif_size_input_layout.addWidget(self.gif_width_spin)
         
-        gif_size_input_layout.addWidget(QLabel("高:"))
+        gif_size_input_layout.addWidget(QLabel(self._LBL_HEIGHT))
         self.gif_height_spin = QSpinBox()
         self.gif_height_spin.setRange(config.FRAME_SIZE_MIN, config.GIF_SIZE_MAX)
         self.gif_height_spin.setValue(config.GIF_HEIGHT_DEFAULT)
@@ -351,23 +382,6 @@ class ExportDialog(QDialog):
         
         layout.addWidget(size_group)
         
-        # 缩放算法选择
-        gif_resample_group = QGroupBox("缩放算法")
-        gif_resample_layout = QHBoxLayout(gif_resample_group)
-        
-        gif_resample_layout.addWidget(QLabel("算法:"))
-        self.gif_resample_combo = QComboBox()
-        self.gif_resample_combo.addItem("📍 最近邻 (像素风格)", ResampleFilter.NEAREST.value)
-        self.gif_resample_combo.addItem("📊 盒式滤波", ResampleFilter.BOX.value)
-        self.gif_resample_combo.addItem("🌀 双线性 (平滑)", ResampleFilter.BILINEAR.value)
-        self.gif_resample_combo.addItem("🔊 Hamming", ResampleFilter.HAMMING.value)
-        self.gif_resample_combo.addItem("✨ 双三次 (高质量)", ResampleFilter.BICUBIC.value)
-        self.gif_resample_combo.addItem("🌟 Lanczos (最高质量)", ResampleFilter.LANCZOS.value)
-        self.gif_resample_combo.setCurrentIndex(5)  # 默认Lanczos
-        gif_resample_layout.addWidget(self.gif_resample_combo, 1)
-        
-        layout.addWidget(gif_resample_group)
-        
         # 优化选项
         self.optimize_check = QCheckBox("优化文件大小")
         self.optimize_check.setChecked(True)
@@ -391,7 +405,7 @@ class ExportDialog(QDialog):
         size_layout.addWidget(self.frames_original_size_check)
         
         frames_size_input_layout = QHBoxLayout()
-        frames_size_input_layout.addWidget(QLabel("宽:"))
+        frames_size_input_layout.addWidget(QLabel(self._LBL_WIDTH))
         self.frames_width_spin = QSpinBox()
         self.frames_width_spin.setRange(config.FRAME_SIZE_MIN, config.FRAME_SIZE_MAX)
         self.frames_width_spin.setValue(config.FRAME_WIDTH_DEFAULT)
@@ -399,7 +413,7 @@ class ExportDialog(QDialog):
         self.frames_width_spin.valueChanged.connect(self._on_frames_width_changed)
         frames_size_input_layout.addWidget(self.frames_width_spin)
         
-        frames_size_input_layout.addWidget(QLabel("高:"))
+        frames_size_input_layout.addWidget(QLabel(self._LBL_HEIGHT))
         self.frames_height_spin = QSpinBox()
         self.frames_height_spin.setRange(config.FRAME_SIZE_MIN, config.FRAME_SIZE_MAX)
         self.frames_height_spin.setValue(config.FRAME_HEIGHT_DEFAULT)
@@ -414,23 +428,6 @@ class ExportDialog(QDialog):
         size_layout.addLayout(frames_size_input_layout)
         layout.addWidget(size_group)
         
-        # 缩放算法选择
-        frames_resample_group = QGroupBox("缩放算法")
-        frames_resample_layout = QHBoxLayout(frames_resample_group)
-        
-        frames_resample_layout.addWidget(QLabel("算法:"))
-        self.frames_resample_combo = QComboBox()
-        self.frames_resample_combo.addItem("📍 最近邻 (像素风格)", ResampleFilter.NEAREST.value)
-        self.frames_resample_combo.addItem("📊 盒式滤波", ResampleFilter.BOX.value)
-        self.frames_resample_combo.addItem("🌀 双线性 (平滑)", ResampleFilter.BILINEAR.value)
-        self.frames_resample_combo.addItem("🔊 Hamming", ResampleFilter.HAMMING.value)
-        self.frames_resample_combo.addItem("✨ 双三次 (高质量)", ResampleFilter.BICUBIC.value)
-        self.frames_resample_combo.addItem("🌟 Lanczos (最高质量)", ResampleFilter.LANCZOS.value)
-        self.frames_resample_combo.setCurrentIndex(5)  # 默认Lanczos
-        frames_resample_layout.addWidget(self.frames_resample_combo, 1)
-        
-        layout.addWidget(frames_resample_group)
-        
         # 提示
         hint_label = QLabel(
             "📁 导出说明：\n"
@@ -492,7 +489,7 @@ class ExportDialog(QDialog):
         size_layout.addWidget(self.godot_original_size_check)
         
         godot_size_input_layout = QHBoxLayout()
-        godot_size_input_layout.addWidget(QLabel("宽:"))
+        godot_size_input_layout.addWidget(QLabel(self._LBL_WIDTH))
         self.godot_width_spin = QSpinBox()
         self.godot_width_spin.setRange(config.FRAME_SIZE_MIN, config.GIF_SIZE_MAX)
         self.godot_width_spin.setValue(config.FRAME_WIDTH_DEFAULT)
@@ -500,7 +497,7 @@ class ExportDialog(QDialog):
         self.godot_width_spin.valueChanged.connect(self._on_godot_width_changed)
         godot_size_input_layout.addWidget(self.godot_width_spin)
         
-        godot_size_input_layout.addWidget(QLabel("高:"))
+        godot_size_input_layout.addWidget(QLabel(self._LBL_HEIGHT))
         self.godot_height_spin = QSpinBox()
         self.godot_height_spin.setRange(config.FRAME_SIZE_MIN, config.GIF_SIZE_MAX)
         self.godot_height_spin.setValue(config.FRAME_HEIGHT_DEFAULT)
@@ -515,23 +512,6 @@ class ExportDialog(QDialog):
         size_layout.addLayout(godot_size_input_layout)
         layout.addWidget(size_group)
         
-        # 缩放算法
-        godot_resample_group = QGroupBox("缩放算法")
-        godot_resample_layout = QHBoxLayout(godot_resample_group)
-        
-        godot_resample_layout.addWidget(QLabel("算法:"))
-        self.godot_resample_combo = QComboBox()
-        self.godot_resample_combo.addItem("📍 最近邻 (像素风格)", ResampleFilter.NEAREST.value)
-        self.godot_resample_combo.addItem("📊 盒式滤波", ResampleFilter.BOX.value)
-        self.godot_resample_combo.addItem("🌀 双线性 (平滑)", ResampleFilter.BILINEAR.value)
-        self.godot_resample_combo.addItem("🔊 Hamming", ResampleFilter.HAMMING.value)
-        self.godot_resample_combo.addItem("✨ 双三次 (高质量)", ResampleFilter.BICUBIC.value)
-        self.godot_resample_combo.addItem("🌟 Lanczos (最高质量)", ResampleFilter.LANCZOS.value)
-        self.godot_resample_combo.setCurrentIndex(5)
-        godot_resample_layout.addWidget(self.godot_resample_combo, 1)
-        
-        layout.addWidget(godot_resample_group)
-        
         # 提示
         hint_label = QLabel(
             "🎮 导出说明：\n"
@@ -547,100 +527,92 @@ class ExportDialog(QDialog):
         return widget
     
     def _on_original_size_changed(self, state):
-        enabled = state != Qt.Checked
+        enabled = state != self._CHECKED
         self.frame_width_spin.setEnabled(enabled)
         self.frame_height_spin.setEnabled(enabled)
         self.lock_ratio_check.setEnabled(enabled)
     
     def _on_sprite_width_changed(self, value):
-        if self._updating_size or not self.lock_ratio_check.isChecked():
+        if not self.lock_ratio_check.isChecked():
             return
         if self._aspect_ratio > 0:
-            self._updating_size = True
             new_height = int(value / self._aspect_ratio)
-            self.frame_height_spin.setValue(new_height)
-            self._updating_size = False
+            with QSignalBlocker(self.frame_height_spin):
+                self.frame_height_spin.setValue(new_height)
     
     def _on_sprite_height_changed(self, value):
-        if self._updating_size or not self.lock_ratio_check.isChecked():
+        if not self.lock_ratio_check.isChecked():
             return
         if value > 0:
-            self._updating_size = True
             new_width = int(value * self._aspect_ratio)
-            self.frame_width_spin.setValue(new_width)
-            self._updating_size = False
+            with QSignalBlocker(self.frame_width_spin):
+                self.frame_width_spin.setValue(new_width)
     
     def _on_gif_original_size_changed(self, state):
-        enabled = state != Qt.Checked
+        enabled = state != self._CHECKED
         self.gif_width_spin.setEnabled(enabled)
         self.gif_height_spin.setEnabled(enabled)
         self.gif_lock_ratio_check.setEnabled(enabled)
     
     def _on_gif_width_changed(self, value):
-        if self._updating_size or not self.gif_lock_ratio_check.isChecked():
+        if not self.gif_lock_ratio_check.isChecked():
             return
         if self._aspect_ratio > 0:
-            self._updating_size = True
             new_height = int(value / self._aspect_ratio)
-            self.gif_height_spin.setValue(new_height)
-            self._updating_size = False
+            with QSignalBlocker(self.gif_height_spin):
+                self.gif_height_spin.setValue(new_height)
     
     def _on_gif_height_changed(self, value):
-        if self._updating_size or not self.gif_lock_ratio_check.isChecked():
+        if not self.gif_lock_ratio_check.isChecked():
             return
         if value > 0:
-            self._updating_size = True
             new_width = int(value * self._aspect_ratio)
-            self.gif_width_spin.setValue(new_width)
-            self._updating_size = False
+            with QSignalBlocker(self.gif_width_spin):
+                self.gif_width_spin.setValue(new_width)
     
     def _on_godot_original_size_changed(self, state):
-        enabled = state != Qt.Checked
+        enabled = state != self._CHECKED
         self.godot_width_spin.setEnabled(enabled)
         self.godot_height_spin.setEnabled(enabled)
         self.godot_lock_ratio_check.setEnabled(enabled)
     
     def _on_godot_width_changed(self, value):
-        if self._updating_size or not self.godot_lock_ratio_check.isChecked():
+        if not self.godot_lock_ratio_check.isChecked():
             return
         if self._aspect_ratio > 0:
-            self._updating_size = True
             new_height = int(value / self._aspect_ratio)
-            self.godot_height_spin.setValue(new_height)
-            self._updating_size = False
+            with QSignalBlocker(self.godot_height_spin):
+                self.godot_height_spin.setValue(new_height)
     
     def _on_godot_height_changed(self, value):
-        if self._updating_size or not self.godot_lock_ratio_check.isChecked():
+        if not self.godot_lock_ratio_check.isChecked():
             return
         if value > 0:
-            self._updating_size = True
             new_width = int(value * self._aspect_ratio)
-            self.godot_width_spin.setValue(new_width)
-            self._updating_size = False
+            with QSignalBlocker(self.godot_width_spin):
+                self.godot_width_spin.setValue(new_width)
     
     def _on_frames_original_size_changed(self, state):
-        enabled = state != Qt.Checked
+        enabled = state != self._CHECKED
         self.frames_width_spin.setEnabled(enabled)
         self.frames_height_spin.setEnabled(enabled)
         self.frames_lock_ratio_check.setEnabled(enabled)
     
     def _on_frames_width_changed(self, value):
-        if self._updating_size or not self.frames_lock_ratio_check.isChecked():
+        if not self.frames_lock_ratio_check.isChecked():
             return
         if self._aspect_ratio > 0:
-            self._updating_size = True
             new_height = int(value / self._aspect_ratio)
-            self.frames_height_spin.setValue(new_height)
-            self._updating_size = False
+            with QSignalBlocker(self.frames_height_spin):
+                self.frames_height_spin.setValue(new_height)
     
     def _on_frames_height_changed(self, value):
-        if self._updating_size or not self.frames_lock_ratio_check.isChecked():
+        if not self.frames_lock_ratio_check.isChecked():
             return
         if value > 0:
-            self._updating_size = True
             new_width = int(value * self._aspect_ratio)
-            self.frames_width_spin.setValue(new_width)
-            self._updating_size = False
+            with QSignalBlocker(self.frames_width_spin):
+                self.frames_width_spin.setValue(new_width)
     
 
     
@@ -662,47 +634,64 @@ class ExportDialog(QDialog):
     
     def _on_webp_quality_changed(self, value):
         """WebP质量滑块变化"""
-        self.webp_quality_label.setText(str(value))
+        self.webp_quality_label.setNum(value)
     
     def _on_quality_changed(self, value):
         """质量滑块变化"""
-        self.quality_label.setText(str(value))
+        self.quality_label.setNum(value)
+    
+    def _load_last_export_dir(self):
+        """加载上次导出路径"""
+        if not self.path_edit.text():
+            self.path_edit.setText(config.last_export_dir or "")
     
     def _browse_path(self):
         # 从上次路径或当前路径开始
         start_dir = self.path_edit.text() or config.last_export_dir or ""
-        path = QFileDialog.getExistingDirectory(self, "选择保存目录", start_dir)
+        # 不加载自定义目录图标，避免子目录很多时枚举图标卡顿
+        path = QFileDialog.getExistingDirectory(
+            self, "选择保存目录", start_dir,
+            QFileDialog.ShowDirsOnly | QFileDialog.DontUseCustomDirectoryIcons
+        )
         if path:
             self.path_edit.setText(path)
-            # 保存路径到配置
-            config.last_export_dir = path
+            # 保存路径到配置（config 内部延迟合并写入）
+            self._save_export_dir()
+    
+    def _save_export_dir(self):
+        """将当前导出目录写入配置，仅在变化时落盘"""
+        dir_text = self.path_edit.text()
+        if dir_text and dir_text != config.last_export_dir:
+            config.last_export_dir = dir_text
     
     def _on_export_clicked(self):
         """点击导出按钮 - 检查文件是否存在"""
         # 检查是否选择了输出目录
-        if not self.path_edit.text():
+        dir_text = self.path_edit.text()
+        if not dir_text:
             QMessageBox.warning(self, "提示", "请选择保存目录")
             return
         
         # 检查文件是否已存在
-        output_path = Path(self.path_edit.text())
+        output_path = Path(dir_text)
         output_name = self.name_edit.text() or "default"
         
         # 根据当前选中的格式检查文件
         file_exists = False
         existing_files = []
         
-        if self.tab_widget.currentIndex() == 0:  # 精灵图
+        current_tab = self.tab_widget.currentIndex()
+        if current_tab == 0:  # 精灵图
             sprite_file = output_path / f"{output_name}.png"
             if sprite_file.exists():
                 file_exists = True
                 existing_files.append(sprite_file.name)
-        elif self.tab_widget.currentIndex() == 1:  # GIF
+        elif current_tab == 1:  # GIF
             gif_file = output_path / f"{output_name}.gif"
             if gif_file.exists():
                 file_exists = True
                 existing_files.append(gif_file.name)
-        elif self.tab_widget.currentIndex() == 2:  # 单独帧
+        elif current_tab == 2:  # 单独帧
             # 检查输出目录是否存在
             if output_path.exists():
                 # 检查是否有与输出名称相关的文件存在
@@ -713,7 +702,7 @@ class ExportDialog(QDialog):
                     existing_files = [Path(f).name for f in existing_files[:3]]  # 只显示前3个文件
                     if len(existing_files) > 3:
                         existing_files.append("...")
-        elif self.tab_widget.currentIndex() == 3:  # WebP格式
+        elif current_tab == 3:  # WebP格式
             # 检查输出目录是否存在
             if output_path.exists():
                 # 检查是否有与输出名称相关的文件存在
@@ -738,7 +727,7 @@ class ExportDialog(QDialog):
                 return
         
         # 保存路径到配置
-        config.last_export_dir = self.path_edit.text()
+        self._save_export_dir()
         
         # 接受对话框
         self.accept()
@@ -759,7 +748,15 @@ class ExportDialog(QDialog):
             # self.godot_height_spin.setValue(height)
     
     def get_config(self) -> ExportConfig:
-        """获取导出配置"""
+        """获取导出配置
+        
+        返回缓存配置的浅拷贝：调用方可以替换顶层字段（如 frame_indices），
+        但不要原地修改 sprite_config、gif_config 等子配置，它们与缓存共享。
+        """
+        # 选项未变化时直接返回缓存配置的副本
+        if not self._config_dirty:
+            return self._config.model_copy()
+        
         config = ExportConfig()
         
         # 根据选项卡和格式选项组合确定最终导出格式
@@ -779,8 +776,9 @@ class ExportDialog(QDialog):
         
         # 输出路径
         config.output_name = self.name_edit.text() or "default"
-        if self.path_edit.text():
-            config.output_path = Path(self.path_edit.text())
+        dir_text = self.path_edit.text()
+        if dir_text:
+            config.output_path = Path(dir_text)
         
         # 精灵图配置
         if self.grid_radio.isChecked():
@@ -793,7 +791,9 @@ class ExportDialog(QDialog):
         
         config.sprite_config.padding = self.padding_spin.value()
         config.sprite_config.generate_json = False  # 取消JSON元数据生成功能
-        config.sprite_config.resample_filter = ResampleFilter(self.resample_combo.currentData())
+        # 缩放算法（所有选项卡共用）
+        resample_filter = _FILTER_BY_VALUE[self.resample_combo.currentData()]
+        config.sprite_config.resample_filter = resample_filter
         
         if not self.original_size_check.isChecked():
             config.sprite_config.frame_width = self.frame_width_spin.value()
@@ -803,7 +803,7 @@ class ExportDialog(QDialog):
         config.gif_config.fps = self.gif_fps_spin.value()
         config.gif_config.loop = self.loop_spin.value()
         config.gif_config.optimize = self.optimize_check.isChecked()
-        config.gif_config.resample_filter = ResampleFilter(self.gif_resample_combo.currentData())
+        config.gif_config.resample_filter = resample_filter
         
         if not self.gif_original_size_check.isChecked():
             config.gif_config.frame_width = self.gif_width_spin.value()
@@ -813,7 +813,7 @@ class ExportDialog(QDialog):
         # config.godot_config.animation_name = self.godot_anim_name_edit.text() or "default"
         # config.godot_config.fps = self.godot_fps_spin.value()
         # config.godot_config.loop = self.godot_loop_check.isChecked()
-        # config.godot_config.resample_filter = ResampleFilter(self.godot_resample_combo.currentData())
+        # config.godot_config.resample_filter = resample_filter
         # 
         # if not self.godot_original_size_check.isChecked():
         #     config.godot_config.frame_width = self.godot_width_spin.value()
@@ -822,22 +822,16 @@ class ExportDialog(QDialog):
         # WebP配置
         if config.format == ExportFormat.WEBP:
             config.webp_config.quality = self.webp_quality_slider.value()
-            # 使用与当前选项卡相同的缩放算法
-            if self.tab_widget.currentIndex() == 0:
-                config.webp_config.resample_filter = ResampleFilter(self.resample_combo.currentData())
-            elif self.tab_widget.currentIndex() == 1:
-                config.webp_config.resample_filter = ResampleFilter(self.gif_resample_combo.currentData())
-            elif self.tab_widget.currentIndex() == 2:
-                config.webp_config.resample_filter = ResampleFilter(self.frames_resample_combo.currentData())
+            config.webp_config.resample_filter = resample_filter
             
             # 使用与当前选项卡相同的尺寸设置
-            if self.tab_widget.currentIndex() == 0 and not self.original_size_check.isChecked():
+            if current_tab == 0 and not self.original_size_check.isChecked():
                 config.webp_config.frame_width = self.frame_width_spin.value()
                 config.webp_config.frame_height = self.frame_height_spin.value()
-            elif self.tab_widget.currentIndex() == 1 and not self.gif_original_size_check.isChecked():
+            elif current_tab == 1 and not self.gif_original_size_check.isChecked():
                 config.webp_config.frame_width = self.gif_width_spin.value()
                 config.webp_config.frame_height = self.gif_height_spin.value()
-            elif self.tab_widget.currentIndex() == 2 and not self.frames_original_size_check.isChecked():
+            elif current_tab == 2 and not self.frames_original_size_check.isChecked():
                 config.webp_config.frame_width = self.frames_width_spin.value()
                 config.webp_config.frame_height = self.frames_height_spin.value()
         
@@ -847,4 +841,6 @@ class ExportDialog(QDialog):
         config.pngquant_config.quality_min = max(quality - 20, 0)
         config.pngquant_config.quality_max = quality
         
-        return config
+        self._config = config
+        self._config_dirty = False
+        return config.model_copy()
@@ -1,17 +1,21 @@
 """帧预览网格控件"""
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 from dataclasses import dataclass
 from PySide6.QtWidgets import (
-    QWidget, QScrollArea, QGridLayout, QLabel, 
+    QWidget, QScrollArea, QLabel, 
     QVBoxLayout, QHBoxLayout, QCheckBox, QFrame, QSizePolicy,
     QPushButton, QDialog, QSpinBox, QSlider, QComboBox, QGroupBox,
     QMessageBox, QColorDialog
 )
-from PySide6.QtCore import Qt, Signal, QSize, QEvent, QPoint
+from PySide6.QtCore import Qt, Signal, QSize, QEvent, QPoint, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtGui import QPixmap, QImage, QPainter, QColor, QCursor, QPen
 import numpy as np
+import cv2
 
-from src.utils.image_utils import numpy_to_qpixmap, composite_on_checkerboard
+from src.utils.image_utils import (
+    numpy_to_qpixmap, composite_on_checkerboard, ensure_uint8,
+    create_checkerboard, blend_over_background, blend_over_color
+)
 from src.utils.config import config
 from src.core.magic_wand import MagicWand, clean_small_regions, grow_selection, shrink_selection
 
@@ -215,18 +219,6 @@ class EditorHistory:
         self._current_index = -1
 
 
-def _create_checkerboard_fast(width: int, height: int, square_size: int = 10) -> np.ndarray:
-    """快速创建棋盘格背景"""
-    board = np.zeros((height, width, 3), dtype=np.uint8)
-    y_coords, x_coords = np.ogrid[:height, :width]
-    grid_x = x_coords // square_size
-    grid_y = y_coords // square_size
-    use_color1 = ((grid_x + grid_y) % 2 == 0)
-    board[use_color1] = [200, 200, 200]
-    board[~use_color1] = [255, 255, 255]
-    return board
-
-
 class EditorCanvas(QWidget):
     """编辑器画布 - 支持选区显示和魔棒工具"""
     
@@ -242,7 +234,6 @@ class EditorCanvas(QWidget):
         self._selection_mask: Optional[np.ndarray] = None
         
         self._bg_mode = "checkerboard"
-        self._checkerboard_cache: Optional[np.ndarray] = None
         
         self._zoom = 1.0
         self._min_zoom = 0.1
@@ -300,22 +291,17 @@ class EditorCanvas(QWidget):
     
     def _composite_background(self, image: np.ndarray) -> np.ndarray:
         h, w = image.shape[:2]
-        alpha = image[:, :, 3:4] / 255.0
-        rgb = image[:, :, :3]
         
+        # 整数 alpha 混合，不经过浮点中间数组
         if self._bg_mode == "checkerboard":
-            if self._checkerboard_cache is None or self._checkerboard_cache.shape[:2] != (h, w):
-                self._checkerboard_cache = _create_checkerboard_fast(w, h)
-            bg = self._checkerboard_cache
+            # 共享的 LRU 缓存棋盘格(只读)
+            return blend_over_background(image, create_checkerboard(w, h))
         elif self._bg_mode == "white":
-            bg = np.full((h, w, 3), 255, dtype=np.uint8)
+            return blend_over_color(image, (255, 255, 255))
         elif self._bg_mode == "black":
-            bg = np.full((h, w, 3), 0, dtype=np.uint8)
+            return blend_over_color(image, (0, 0, 0))
         else:
-            bg = np.full((h, w, 3), 128, dtype=np.uint8)
-        
-        result = (rgb * alpha + bg * (1 - alpha)).astype(np.uint8)
-        return result
+            return blend_over_color(image, (128, 128, 128))
     
     def _fit_to_view(self):
         if self._display_pixmap is None:
@@ -1307,6 +1293,13 @@ class FrameEditorDialog(QDialog):
         super().reject()
 
 
+def _transparent_percent(alpha: np.ndarray) -> float:
+    """计算透明像素(alpha < 128)占比，完全不透明时跳过统计"""
+    if alpha.min() == 255:
+        return 0.0
+    return np.count_nonzero(alpha < 128) * (100.0 / alpha.size)
+
+
 class FrameZoomDialog(QDialog):
     """帧放大预览对话框 - 支持左右切换和缩放"""
     
@@ -1315,13 +1308,16 @@ class FrameZoomDialog(QDialog):
     
     def __init__(self, images: List[np.ndarray], frame_indices: List[int], current_index: int = 0, parent=None):
         super().__init__(parent)
-        self.images = list(images)
+        self.images = [ensure_uint8(img) for img in images]
         self.frame_indices = list(frame_indices)
         self.current_index = current_index
         self.zoom_factor = 1.0  # 缩放因子
         self.max_zoom = 32.0     # 最大缩放
         self.min_zoom = 0.1     # 最小缩放
         self.bg_mode = "checkerboard"
+        self._display_pixmap: Optional[QPixmap] = None  # 当前帧+背景模式对应的显示图
+        self._display_source = None  # (图像, 背景模式)，用于判断显示图是否需要重建
+        self._size_bucket = None  # 按 16px 取整的窗口尺寸，过滤细微的尺寸变化
         
         self.setWindowTitle(f"帧 #{self.frame_indices[self.current_index]} - 放大预览")
         self.setMinimumSize(800, 600)
@@ -1419,7 +1415,7 @@ class FrameZoomDialog(QDialog):
         info = f"尺寸: {w}x{h} | 通道: {channels}"
         if channels == 4:
             alpha = self.images[self.current_index][:, :, 3]
-            transparent = np.sum(alpha < 128) / alpha.size * 100
+            transparent = _transparent_percent(alpha)
             info += f" | 透明: {transparent:.1f}%"
         
         info_label = QLabel(info)
@@ -1449,32 +1445,13 @@ class FrameZoomDialog(QDialog):
     def _display_image(self):
         """显示当前帧图像"""
         current_image = self.images[self.current_index]
-        
-        # 根据背景模式处理透明通道
-        display_image = current_image
-        if len(current_image.shape) == 3 and current_image.shape[2] == 4:
-            if self.bg_mode == "checkerboard":
-                display_image = composite_on_checkerboard(current_image, square_size=15)
-            elif self.bg_mode == "gray":
-                from PIL import Image
-                pil_img = Image.fromarray(current_image)
-                background = Image.new('RGBA', pil_img.size, (128, 128, 128, 255))
-                pil_img = Image.alpha_composite(background, pil_img)
-                display_image = np.array(pil_img)
-            else:
-                from PIL import Image
-                pil_img = Image.fromarray(current_image)
-                if self.bg_mode == "white":
-                    background = Image.new('RGBA', pil_img.size, (255, 255, 255, 255))
-                else:
-                    background = Image.new('RGBA', pil_img.size, (0, 0, 0, 255))
-                pil_img = Image.alpha_composite(background, pil_img)
-                display_image = np.array(pil_img)
-        
-        pixmap = numpy_to_qpixmap(display_image)
+        source = self._display_source
+        if source is None or source[0] is not current_image or source[1] != self.bg_mode:
+            self._display_pixmap = self._build_display_pixmap(current_image)
+            self._display_source = (current_image, self.bg_mode)
         
         # 使用自定义画布显示图像
-        self.image_canvas.set_pixmap(pixmap, reset_view=False)
+        self.image_canvas.set_pixmap(self._display_pixmap, reset_view=False)
         # 同步缩放级别
         self.image_canvas.set_zoom(self.zoom_factor)
         
@@ -1494,6 +1471,22 @@ class FrameZoomDialog(QDialog):
         # 更新信息显示
         self._update_info()
     
+    def _build_display_pixmap(self, current_image: np.ndarray) -> QPixmap:
+        """按背景模式合成透明通道并生成显示用 QPixmap"""
+        # 根据背景模式处理透明通道
+        display_image = current_image
+        if len(current_image.shape) == 3 and current_image.shape[2] == 4:
+            if self.bg_mode == "checkerboard":
+                display_image = composite_on_checkerboard(current_image, square_size=15)
+            elif self.bg_mode == "gray":
+                display_image = blend_over_color(current_image, (128, 128, 128))
+            elif self.bg_mode == "white":
+                display_image = blend_over_color(current_image, (255, 255, 255))
+            else:
+                display_image = blend_over_color(current_image, (0, 0, 0))
+        
+        return numpy_to_qpixmap(display_image)
+    
     def _prev_frame(self):
         """切换到上一帧"""
         if self.current_index > 0:
@@ -1553,7 +1546,7 @@ class FrameZoomDialog(QDialog):
         info = f"尺寸: {w}x{h} | 通道: {channels}"
         if channels == 4:
             alpha = current_image[:, :, 3]
-            transparent = np.sum(alpha < 128) / alpha.size * 100
+            transparent = _transparent_percent(alpha)
             info += f" | 透明: {transparent:.1f}%"
         
         # 找到对应的info_label并更新文本
@@ -1564,6 +1557,11 @@ class FrameZoomDialog(QDialog):
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        size = event.size()
+        bucket = (size.width() // 16, size.height() // 16)
+        if bucket == self._size_bucket:
+            return
+        self._size_bucket = bucket
         self._display_image()
     
     def _on_export_clicked(self):
@@ -1589,11 +1587,56 @@ class FrameZoomDialog(QDialog):
     def update_image(self, index: int, image: np.ndarray):
         """更新指定索引的图像"""
         if 0 <= index < len(self.images):
-            self.images[index] = image
+            self.images[index] = ensure_uint8(image)
             if index == self.current_index:
                 self._display_image()
 
 
+def _scale_to_thumbnail(image: np.ndarray, thumbnail_size: int) -> np.ndarray:
+    """按比例缩放到缩略图尺寸（缩小用 INTER_AREA）"""
+    h, w = image.shape[:2]
+    scale = thumbnail_size / max(h, w)
+    if scale == 1.0:
+        return image
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+    return cv2.resize(image, size, interpolation=interpolation)
+
+
+def _prepare_thumbnail(image: np.ndarray, thumbnail_size: int) -> np.ndarray:
+    """生成缩略图像素：透明通道先合成到棋盘格背景，再在 numpy 中缩放"""
+    if len(image.shape) == 3 and image.shape[2] == 4:
+        return _scale_to_thumbnail(composite_on_checkerboard(image), thumbnail_size)
+    return _scale_to_thumbnail(image, thumbnail_size)
+
+
+class _ThumbnailRenderSignals(QObject):
+    """缩略图渲染任务的结果信号（跨线程排队投递到 GUI 线程）"""
+    rendered = Signal(int, int, object)  # frame_index, token, 缩略图像素(np.ndarray)
+    failed = Signal(int, int, str)  # frame_index, token, 错误信息
+
+
+class _ThumbnailRenderTask(QRunnable):
+    """在线程池中合成并缩放缩略图，产出 numpy 像素，由 GUI 线程一次性转换为 QPixmap"""
+    
+    def __init__(self, frame_index: int, token: int, image: np.ndarray,
+                 thumbnail_size: int, signals: _ThumbnailRenderSignals):
+        super().__init__()
+        self._frame_index = frame_index
+        self._token = token
+        self._image = image
+        self._thumbnail_size = thumbnail_size
+        self._signals = signals
+    
+    def run(self):
+        try:
+            pixels = np.ascontiguousarray(_prepare_thumbnail(self._image, self._thumbnail_size))
+        except Exception as e:
+            self._signals.failed.emit(self._frame_index, self._token, str(e))
+            return
+        self._signals.rendered.emit(self._frame_index, self._token, pixels)
+
+
 class FrameThumbnail(QFrame):
     """单个帧缩略图控件"""
     
@@ -1601,13 +1644,37 @@ class FrameThumbnail(QFrame):
     double_clicked = Signal(int)  # frame_index - 双击放大
     selection_changed = Signal(int, bool)  # frame_index, is_selected
     
+    # 选中/未选中样式表，避免每次切换都重新构造字符串
+    _SEL_SS = """
+        FrameThumbnail { 
+            background-color: #0078d4; 
+            border: 2px solid #00b8d4; 
+            border-radius: 6px; 
+        }
+        QLabel { color: white; }
+    """
+    _UNSEL_SS = """
+        FrameThumbnail { 
+            background-color: #2d2d2d; 
+            border: 1px solid #3d3d3d; 
+            border-radius: 6px; 
+        }
+        FrameThumbnail:hover {
+            background-color: #3d3d3d;
+            border-color: #4d4d4d;
+        }
+        QLabel { color: #888; }
+    """
+    
     def __init__(self, frame_index: int, thumbnail_size: int = 120, parent=None):
         super().__init__(parent)
         self.frame_index = frame_index
         self.thumbnail_size = thumbnail_size
         self._is_selected = False
+        self._setting_selection = False  # 程序设置选中状态时忽略复选框回调
         self._image: Optional[np.ndarray] = None
         self._display_pixmap: Optional[QPixmap] = None  # 缓存显示用的 pixmap
+        self._cached_key: Optional[tuple] = None  # _display_pixmap 对应的 (数据地址, 形状, 尺寸)
         self._tag: Optional[str] = None  # 帧标签
         
         self.setup_ui()
@@ -1657,11 +1724,32 @@ class FrameThumbnail(QFrame):
         self.setFrameStyle(QFrame.Box)
         self.update_style()
     
-    def set_image(self, image: np.ndarray):
-        """设置图像"""
+    def set_image(self, image: np.ndarray, pixmap: Optional[QPixmap] = None):
+        """设置图像
+        
+        Args:
+            image: 帧图像
+            pixmap: 已渲染好的缩略图，提供时跳过合成与缩放
+        """
+        image = ensure_uint8(image)
+        if image is not self._image:
+            self._cached_key = None
         self._image = image
+        if pixmap is not None and image is not None:
+            self._display_pixmap = pixmap
+            self._cached_key = (image.ctypes.data, image.shape, self.thumbnail_size)
         self._update_pixmap()
     
+    def rebind(self, frame_index: int, image: Optional[np.ndarray], tag: Optional[str],
+               selected: bool, pixmap: Optional[QPixmap] = None):
+        """复用控件显示另一帧"""
+        if frame_index != self.frame_index:
+            self.frame_index = frame_index
+            self.index_label.setText(f"#{frame_index}")
+        self.set_image(image, pixmap)
+        self.set_tag(tag)
+        self.set_selected(selected)
+    
     def set_tag(self, tag: Optional[str]):
         """设置帧标签"""
         self._tag = tag
@@ -1675,28 +1763,28 @@ class FrameThumbnail(QFrame):
         """更新 pixmap，缓存合成结果"""
         if self._image is None:
             self._display_pixmap = None
+            self._cached_key = None
             self.image_label.setPixmap(QPixmap())
             return
         
-        # 如果有透明通道，先合成到棋盘格背景
-        display_image = self._image
-        if len(self._image.shape) == 3 and self._image.shape[2] == 4:
-            display_image = composite_on_checkerboard(self._image)
+        # 图像和尺寸都未变化时直接复用已合成的 pixmap
+        key = (self._image.ctypes.data, self._image.shape, self.thumbnail_size)
+        if key == self._cached_key and self._display_pixmap is not None:
+            self.image_label.setPixmap(self._display_pixmap)
+            return
         
-        # 转换为 pixmap 并使用高质量缩放
-        pixmap = numpy_to_qpixmap(display_image)
-        self._display_pixmap = pixmap.scaled(
-            self.thumbnail_size, self.thumbnail_size,
-            Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        self._display_pixmap = numpy_to_qpixmap(_prepare_thumbnail(self._image, self.thumbnail_size))
+        self._cached_key = key
         self.image_label.setPixmap(self._display_pixmap)
     
     def set_selected(self, selected: bool):
         """设置选中状态"""
+        if selected == self._is_selected:
+            return
         self._is_selected = selected
-        self.checkbox.blockSignals(True)
+        self._setting_selection = True
         self.checkbox.setChecked(selected)
-        self.checkbox.blockSignals(False)
+        self._setting_selection = False
         self.update_style()
     
     def eventFilter(self, obj, event):
@@ -1713,6 +1801,8 @@ class FrameThumbnail(QFrame):
         return super().eventFilter(obj, event)
     
     def _on_checkbox_changed(self, state):
+        if self._setting_selection:
+            return
         # PySide6 中 state 可能是 Qt.CheckState 枚举或整数
         is_selected = (state == Qt.CheckState.Checked or state == 2)
         self._is_selected = is_selected
@@ -1720,28 +1810,7 @@ class FrameThumbnail(QFrame):
         self.selection_changed.emit(self.frame_index, self._is_selected)
     
     def update_style(self):
-        if self._is_selected:
-            self.setStyleSheet("""
-                FrameThumbnail { 
-                    background-color: #0078d4; 
-                    border: 2px solid #00b8d4; 
-                    border-radius: 6px; 
-                }
-                QLabel { color: white; }
-            """)
-        else:
-            self.setStyleSheet("""
-                FrameThumbnail { 
-                    background-color: #2d2d2d; 
-                    border: 1px solid #3d3d3d; 
-                    border-radius: 6px; 
-                }
-                FrameThumbnail:hover {
-                    background-color: #3d3d3d;
-                    border-color: #4d4d4d;
-                }
-                QLabel { color: #888; }
-            """)
+        self.setStyleSheet(self._SEL_SS if self._is_selected else self._UNSEL_SS)
     
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -1772,8 +1841,27 @@ class FramePreview(QWidget):
         super().__init__(parent)
         self.thumbnail_size = thumbnail_size
         self.columns = columns
-        self._thumbnails: List[FrameThumbnail] = []
+        # 帧数据（按显示顺序），缩略图控件只为可见区域创建
+        self._frame_indices: List[int] = []
+        self._images: Dict[int, Optional[np.ndarray]] = {}
+        self._tags: Dict[int, Optional[str]] = {}
+        self._selected_set: set = set()
+        self._selected_cache: Optional[List[int]] = None  # 按帧顺序排好的选中索引，选中变化时失效
+        self._pixmap_cache: Dict[int, QPixmap] = {}  # 已渲染的缩略图
+        self._visible_thumbs: Dict[int, FrameThumbnail] = {}  # 网格位置 -> 控件
+        self._thumb_by_index: Dict[int, FrameThumbnail] = {}  # 帧索引 -> 可见控件
+        self._thumb_pool: List[FrameThumbnail] = []  # 空闲控件
+        self._cell_size: Optional[QSize] = None
+        
+        # 缩略图在线程池中渲染，完成后回到 GUI 线程转换为 QPixmap
+        self._render_pool = QThreadPool(self)
+        self._render_signals = _ThumbnailRenderSignals(self)
+        self._render_signals.rendered.connect(self._on_thumbnail_rendered)
+        self._render_signals.failed.connect(self._on_thumbnail_render_failed)
+        self._render_pending: Dict[int, int] = {}  # 帧索引 -> 最新任务 token
+        self._render_token = 0
         self._batch_update_mode = False  # 批量更新模式，禁止信号触发
+        self._pending_emit = False  # 已安排在下一次事件循环合并发送选中变化
         self._last_clicked_index: Optional[int] = None  # 记录最后一次单击选中的帧索引
         
         self.setup_ui()
@@ -1860,97 +1948,237 @@ class FramePreview(QWidget):
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         layout.addWidget(self.scroll_area)
         
-        # 内容容器
+        # 内容容器 - 不使用布局，缩略图按网格位置手动摆放
         self.content_widget = QWidget()
-        self.grid_layout = QGridLayout(self.content_widget)
-        self.grid_layout.setSpacing(8)
-        self.grid_layout.setContentsMargins(8, 8, 8, 8)
-        
         self.scroll_area.setWidget(self.content_widget)
+        
+        # 滚动或视口尺寸变化时重新绑定可见缩略图
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._update_visible_thumbs)
+        self.scroll_area.viewport().installEventFilter(self)
     
-    def clear(self):
-        """清空所有缩略图"""
-        for thumb in self._thumbnails:
-            thumb.deleteLater()
-        self._thumbnails.clear()
+    _GRID_SPACING = 8
+    _GRID_MARGIN = 8
+    _BUFFER_ROWS = 1  # 可见区域上下额外准备的行数
+    
+    def eventFilter(self, obj, event):
+        if obj is self.scroll_area.viewport() and event.type() == QEvent.Type.Resize:
+            self._update_visible_thumbs()
+        return super().eventFilter(obj, event)
+    
+    def _create_thumbnail(self) -> FrameThumbnail:
+        """创建缩略图控件并连接信号"""
+        thumb = FrameThumbnail(-1, self.thumbnail_size, self.content_widget)
+        thumb.clicked.connect(self._on_thumbnail_clicked)
+        thumb.double_clicked.connect(self._on_thumbnail_double_clicked)
+        thumb.selection_changed.connect(self._on_selection_changed)
+        return thumb
+    
+    def _acquire_thumbnail(self) -> FrameThumbnail:
+        if self._thumb_pool:
+            return self._thumb_pool.pop()
+        return self._create_thumbnail()
+    
+    def _release_thumbnail(self, thumb: FrameThumbnail):
+        thumb.hide()
+        self._thumb_pool.append(thumb)
+    
+    def _get_cell_size(self) -> QSize:
+        if self._cell_size is None:
+            thumb = self._acquire_thumbnail()
+            self._cell_size = thumb.sizeHint()
+            self._release_thumbnail(thumb)
+        return self._cell_size
+    
+    def _update_content_size(self):
+        """根据帧数设置内容高度，使滚动条范围与完整网格一致"""
+        count = len(self._frame_indices)
+        if count == 0:
+            self.content_widget.setMinimumHeight(0)
+            return
+        cell = self._get_cell_size()
+        rows = (count + self.columns - 1) // self.columns
+        height = 2 * self._GRID_MARGIN + rows * cell.height() + (rows - 1) * self._GRID_SPACING
+        self.content_widget.setMinimumHeight(height)
+    
+    def _update_visible_thumbs(self, *args):
+        """只为视口内（含缓冲行）的网格位置绑定缩略图控件"""
+        count = len(self._frame_indices)
+        if count == 0:
+            for thumb in self._visible_thumbs.values():
+                self._release_thumbnail(thumb)
+            self._visible_thumbs.clear()
+            self._thumb_by_index.clear()
+            return
         
-        # 清空布局
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        cell = self._get_cell_size()
+        row_height = cell.height() + self._GRID_SPACING
+        col_width = cell.width() + self._GRID_SPACING
+        top = self.scroll_area.verticalScrollBar().value() - self._GRID_MARGIN
+        bottom = top + self.scroll_area.viewport().height()
+        rows = (count + self.columns - 1) // self.columns
+        first_row = max(0, top // row_height - self._BUFFER_ROWS)
+        last_row = min(rows - 1, bottom // row_height + self._BUFFER_ROWS)
+        wanted = range(first_row * self.columns, min(count, (last_row + 1) * self.columns))
+        
+        # 批量重绑期间暂停重绘，结束后统一刷新一次
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # 回收离开可见区域的控件
+            for pos in [p for p in self._visible_thumbs if p not in wanted]:
+                thumb = self._visible_thumbs.pop(pos)
+                self._thumb_by_index.pop(thumb.frame_index, None)
+                self._release_thumbnail(thumb)
+            
+            # 为新进入可见区域的位置绑定控件
+            for pos in wanted:
+                if pos in self._visible_thumbs:
+                    continue
+                thumb = self._acquire_thumbnail()
+                self._bind_thumbnail(thumb, self._frame_indices[pos])
+                row, col = divmod(pos, self.columns)
+                thumb.move(self._GRID_MARGIN + col * col_width, self._GRID_MARGIN + row * row_height)
+                thumb.show()
+                self._visible_thumbs[pos] = thumb
+                self._thumb_by_index[thumb.frame_index] = thumb
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+    
+    def _bind_thumbnail(self, thumb: FrameThumbnail, frame_index: int):
+        """将控件绑定到指定帧，未渲染的缩略图先显示占位并提交后台渲染"""
+        image = self._images.get(frame_index)
+        pixmap = self._pixmap_cache.get(frame_index)
+        if image is not None and pixmap is None:
+            if frame_index not in self._render_pending:
+                self._request_render(frame_index, image)
+            pixmap = QPixmap()
+        thumb.rebind(
+            frame_index, image, self._tags.get(frame_index),
+            frame_index in self._selected_set, pixmap
+        )
+    
+    def _request_render(self, frame_index: int, image: np.ndarray):
+        """提交后台渲染任务，旧任务的结果会因 token 不匹配而被丢弃"""
+        self._render_token += 1
+        self._render_pending[frame_index] = self._render_token
+        self._render_pool.start(_ThumbnailRenderTask(
+            frame_index, self._render_token, image, self.thumbnail_size, self._render_signals
+        ))
+    
+    def _on_thumbnail_rendered(self, frame_index: int, token: int, pixels: np.ndarray):
+        """后台渲染完成"""
+        if self._render_pending.get(frame_index) != token:
+            return
+        del self._render_pending[frame_index]
+        # 零拷贝包装后由 QPixmap.fromImage 复制一次，省去 QImage 中间副本
+        pixmap = numpy_to_qpixmap(pixels)
+        self._pixmap_cache[frame_index] = pixmap
+        thumb = self._thumb_by_index.get(frame_index)
+        if thumb:
+            thumb.set_image(self._images.get(frame_index), pixmap)
+    
+    def _on_thumbnail_render_failed(self, frame_index: int, token: int, error: str):
+        """后台渲染失败，过期任务的失败同样忽略"""
+        if self._render_pending.get(frame_index) != token:
+            return
+        del self._render_pending[frame_index]
+        self.status_message.emit(f"缩略图渲染失败 #{frame_index}: {error}")
+    
+    def _refresh_visible_selection(self):
+        """将选中集合同步到可见缩略图"""
+        for thumb in self._visible_thumbs.values():
+            thumb.set_selected(thumb.frame_index in self._selected_set)
+    
+    def clear(self):
+        """清空所有缩略图（控件回收到池中复用，不逐个 deleteLater）"""
+        self.content_widget.setUpdatesEnabled(False)
+        for thumb in self._visible_thumbs.values():
+            self._release_thumbnail(thumb)
+        # 池中控件不再持有旧帧图像，避免清空后仍占用整帧内存
+        for thumb in self._thumb_pool:
+            thumb.set_image(None)
+        self.content_widget.setUpdatesEnabled(True)
+        self._visible_thumbs.clear()
+        self._thumb_by_index.clear()
+        self._frame_indices = []
+        self._images.clear()
+        self._tags.clear()
+        self._selected_set.clear()
+        self._selected_cache = None
+        self._pixmap_cache.clear()
+        self._render_pool.clear()
+        self._render_pending.clear()
+        self._update_content_size()
     
     def set_frames(self, frames: list):
         """设置帧数据"""
         self.clear()
         
-        for i, frame in enumerate(frames):
-            thumb = FrameThumbnail(frame.index, self.thumbnail_size)
-            
-            # 设置图像
-            if frame.display_image is not None:
-                thumb.set_image(frame.display_image)
-            
-            # 设置标签
-            if hasattr(frame, 'tag') and frame.tag:
-                thumb.set_tag(frame.tag)
-            
-            # 设置选中状态
-            thumb.set_selected(frame.is_selected)
-            
-            # 连接信号
-            thumb.clicked.connect(self._on_thumbnail_clicked)
-            thumb.double_clicked.connect(self._on_thumbnail_double_clicked)
-            thumb.selection_changed.connect(self._on_selection_changed)
-            
-            # 添加到网格
-            row = i // self.columns
-            col = i % self.columns
-            self.grid_layout.addWidget(thumb, row, col)
-            
-            self._thumbnails.append(thumb)
+        for frame in frames:
+            self._frame_indices.append(frame.index)
+            self._images[frame.index] = ensure_uint8(frame.display_image)
+            self._tags[frame.index] = frame.tag if hasattr(frame, 'tag') else None
+            if frame.is_selected:
+                self._selected_set.add(frame.index)
+        self._selected_cache = None
         
+        self._update_content_size()
+        self._update_visible_thumbs()
         self._update_selection_info()
     
     def update_frame(self, index: int, image: np.ndarray):
         """更新单帧图像"""
-        for thumb in self._thumbnails:
-            if thumb.frame_index == index:
-                thumb.set_image(image)
-                break
+        if index not in self._images:
+            return
+        image = ensure_uint8(image)
+        self._images[index] = image
+        self._pixmap_cache.pop(index, None)
+        self._render_pending.pop(index, None)
+        # 可见时后台重新渲染，完成前保留旧缩略图
+        if index in self._thumb_by_index and image is not None:
+            self._request_render(index, image)
     
     def update_selection(self, index: int, selected: bool):
         """更新选中状态"""
-        for thumb in self._thumbnails:
-            if thumb.frame_index == index:
-                thumb.set_selected(selected)
-                break
+        if index not in self._images:
+            return
+        if selected:
+            self._selected_set.add(index)
+        else:
+            self._selected_set.discard(index)
+        self._selected_cache = None
+        thumb = self._thumb_by_index.get(index)
+        if thumb:
+            thumb.set_selected(selected)
     
     def select_all(self):
         """全选"""
-        for thumb in self._thumbnails:
-            thumb.set_selected(True)
+        self._selected_set = set(self._frame_indices)
+        self._selected_cache = list(self._frame_indices)
+        self._refresh_visible_selection()
         self._update_selection_info()
         self.selection_changed.emit(self.get_selected_indices())
     
     def deselect_all(self):
         """取消全选"""
-        for thumb in self._thumbnails:
-            thumb.set_selected(False)
+        self._selected_set.clear()
+        self._selected_cache = []
+        self._refresh_visible_selection()
         self._update_selection_info()
         self.selection_changed.emit(self.get_selected_indices())
     
     def select_indices(self, indices: List[int]):
         """选中指定索引的帧"""
-        indices_set = set(indices)
-        for thumb in self._thumbnails:
-            thumb.set_selected(thumb.frame_index in indices_set)
+        self._selected_set = set(indices) & set(self._frame_indices)
+        self._selected_cache = None
+        self._refresh_visible_selection()
         self._update_selection_info()
         self.selection_changed.emit(self.get_selected_indices())
     
     def get_selected_indices(self) -> List[int]:
         """获取选中的帧索引"""
-        return [thumb.frame_index for thumb in self._thumbnails if thumb._is_selected]
+        if self._selected_cache is None:
+            self._selected_cache = [idx for idx in self._frame_indices if idx in self._selected_set]
+        return list(self._selected_cache)
     
     def _on_interval_select_clicked(self):
         """间隔选帧：在首尾选中帧范围内，每隔 N 帧取 1 帧，首尾帧强制保留"""
@@ -1963,24 +2191,28 @@ class FramePreview(QWidget):
         first_idx = selected_indices[0]
         last_idx = selected_indices[-1]
 
-        # 收集范围内所有帧的 frame_index（按顺序）
-        range_thumbs = sorted(
-            [t for t in self._thumbnails if first_idx <= t.frame_index <= last_idx],
-            key=lambda t: t.frame_index
-        )
-        if not range_thumbs:
+        # 收集范围内所有帧的 frame_index（按顺序，帧列表通常已有序）
+        all_range_indices = [idx for idx in self._frame_indices if first_idx <= idx <= last_idx]
+        if not all_range_indices:
             return
+        all_range_indices.sort()
 
-        # 按步长取帧索引，强制加入首尾
-        all_range_indices = [t.frame_index for t in range_thumbs]
-        new_selection = set(all_range_indices[i] for i in range(0, len(all_range_indices), step))
+        # 按步长切片取帧索引，强制加入首尾
+        new_selection = set(all_range_indices[::step])
         new_selection.add(all_range_indices[0])   # 强制保留首帧
         new_selection.add(all_range_indices[-1])  # 强制保留尾帧
 
-        # 批量更新 UI：范围内按新集合选中/取消，范围外不变
+        # 批量更新：只改动状态真正变化的帧，范围外不变
+        to_deselect = self._selected_set.intersection(all_range_indices) - new_selection
+        to_select = new_selection - self._selected_set
         self.begin_batch_update()
-        for thumb in range_thumbs:
-            thumb.set_selected(thumb.frame_index in new_selection)
+        self._selected_set -= to_deselect
+        self._selected_set |= to_select
+        self._selected_cache = None
+        for idx in to_deselect | to_select:
+            thumb = self._thumb_by_index.get(idx)
+            if thumb:
+                thumb.set_selected(idx in to_select)
         self.end_batch_update()
 
         msg = f"间隔选帧完成：范围 {len(all_range_indices)} 帧 → 保留 {len(new_selection)} 帧（间隔{interval}帧）"
@@ -1995,9 +2227,11 @@ class FramePreview(QWidget):
             
             self.begin_batch_update()
             # 选中范围内的所有帧
-            for thumb in self._thumbnails:
-                if start_idx <= thumb.frame_index <= end_idx:
-                    thumb.set_selected(True)
+            self._selected_set.update(
+                idx for idx in self._frame_indices if start_idx <= idx <= end_idx
+            )
+            self._selected_cache = None
+            self._refresh_visible_selection()
             self.end_batch_update()
             
             # 更新最后点击的索引
@@ -2021,16 +2255,13 @@ class FramePreview(QWidget):
         frame_indices = []
         current_pos = 0
         
-        for i, idx in enumerate(selected_indices):
-            for thumb in self._thumbnails:
-                if thumb.frame_index == idx:
-                    image = thumb.get_image()
-                    if image is not None:
-                        images.append(image)
-                        frame_indices.append(idx)
-                        if idx == frame_index:
-                            current_pos = len(images) - 1
-                    break
+        for idx in selected_indices:
+            image = self._images.get(idx)
+            if image is not None:
+                images.append(image)
+                frame_indices.append(idx)
+                if idx == frame_index:
+                    current_pos = len(images) - 1
         
         if images:
             dialog = FrameEditorDialog(images, frame_indices, current_pos, parent=self)
@@ -2048,7 +2279,21 @@ class FramePreview(QWidget):
         # 记录最后一次选中的帧索引，用于Shift连续选中
         if is_selected:
             self._last_clicked_index = frame_index
+            self._selected_set.add(frame_index)
+        else:
+            self._selected_set.discard(frame_index)
+        self._selected_cache = None
         
+        # 同一轮事件循环内的多次变化合并为一次界面更新和信号
+        if not self._pending_emit:
+            self._pending_emit = True
+            QTimer.singleShot(0, self._flush_selection)
+    
+    def _flush_selection(self):
+        """发送合并后的选中变化"""
+        if not self._pending_emit:
+            return
+        self._pending_emit = False
         self._update_selection_info()
         # 批量更新模式下不发送信号
         if not self._batch_update_mode:
@@ -2061,11 +2306,12 @@ class FramePreview(QWidget):
     def end_batch_update(self):
         """结束批量更新（发送一次信号）"""
         self._batch_update_mode = False
+        self._pending_emit = False
         self._update_selection_info()
         self.selection_changed.emit(self.get_selected_indices())
     
     def _update_selection_info(self):
         """更新选中数量显示"""
-        count = len(self.get_selected_indices())
-        total = len(self._thumbnails)
+        count = len(self._selected_set)
+        total = len(self._frame_indices)
         self.selection_info.setText(f"已选择: {count}/{total} 帧")
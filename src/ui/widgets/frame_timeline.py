@@ -1,8 +1,9 @@
 """帧时间轴控件"""
+import math
 from typing import Optional, Tuple
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QDoubleSpinBox, QVBoxLayout
-from PySide6.QtCore import Qt, Signal, QRectF
-from PySide6.QtGui import QPainter, QColor, QPen, QCursor
+from PySide6.QtCore import Qt, Signal, QRectF, QTimer
+from PySide6.QtGui import QPainter, QColor, QPen, QBrush, QCursor
 
 
 class RangeSelector(QWidget):
@@ -10,10 +11,25 @@ class RangeSelector(QWidget):
 
     range_changed = Signal(float, float)
     seek_requested = Signal(float)
+    preview_requested = Signal(float)  # 拖动手柄时的位置预览，不触发解码
+
+    # 绘制用的画刷和画笔，所有实例共享
+    _BRUSH_BG = QBrush(QColor("#2a2a2a"))
+    _BRUSH_SEL = QBrush(QColor("#0078d4"))
+    _BRUSH_HANDLE = QBrush(QColor("#e6e6e6"))
+    _PEN_CURRENT = QPen(QColor("#ffffff"), 1)
+
+    # 共享的悬停光标，首次创建实例时构建(需要 QApplication 已存在)
+    _HOR_CURSOR: Optional[QCursor] = None
+    _ALL_CURSOR: Optional[QCursor] = None
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        if RangeSelector._HOR_CURSOR is None:
+            RangeSelector._HOR_CURSOR = QCursor(Qt.SizeHorCursor)
+            RangeSelector._ALL_CURSOR = QCursor(Qt.SizeAllCursor)
         self._duration = 0.0
+        self._inv_duration = 0.0  # 1/duration，供坐标换算使用
         self._start = 0.0
         self._end = 0.0
         self._current = 0.0
@@ -26,12 +42,28 @@ class RangeSelector(QWidget):
         self._drag_end = 0.0
         self._is_dragging = False
         self._emit_seek_on_release = False
+        self._hover_zone = None  # 悬停区域 "handle"/"range"/None，仅在变化时更新光标
+
+        # 同一轮事件循环内的多次区间变化合并为一次 range_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._flush_range_changed)
+        self._range_changed_pending = False
 
         self.setMinimumHeight(32)
         self.setMouseTracking(True)
+        self._track = QRectF()  # 轨道区域，仅在尺寸变化时重新计算
+        self._sel_rect = QRectF()  # 绘制时复用的矩形
+        self._handle_rect = QRectF()
+        self._track_left = 0.0
+        self._track_w = 0.0
+        self._inv_track_w = 0.0
+        self._update_track_rect()
 
     def set_duration(self, duration: float):
         self._duration = max(0.0, duration)
+        self._inv_duration = 1.0 / self._duration if self._duration > 0 else 0.0
         self._start = 0.0
         self._end = self._duration
         self.update()
@@ -40,18 +72,14 @@ class RangeSelector(QWidget):
         self._fps = max(0.0, fps)
         self._min_range = (1.0 / self._fps) if self._fps > 0 else 0.0
 
-    def set_range(self, start: float, end: float):
-        """设置时间范围"""
+    def set_range(self, start: float, end: float, emit: bool = False):
+        """设置时间范围，emit 为 True 时随后发送 range_changed"""
         start, end = self._normalize_range(start, end)
-        self.start_spin.blockSignals(True)
-        self.end_spin.blockSignals(True)
-        self.start_spin.setValue(start)
-        self.end_spin.setValue(end)
-        self.start_spin.blockSignals(False)
-        self.end_spin.blockSignals(False)
-
-        self.range_selector.set_range(start, end, emit=False)
-        self._update_duration_label()
+        self._start = start
+        self._end = end
+        if emit:
+            self._schedule_range_changed()
+        self.update()
 
     def set_current_position(self, position: float):
         self._current = max(0.0, min(position, self._duration)) if self._duration > 0 else 0.0
@@ -61,50 +89,51 @@ class RangeSelector(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        track = self._track_rect()
+        track = self._track
         if track.width() <= 0:
             return
 
         # Track background
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor("#2a2a2a"))
+        painter.setBrush(self._BRUSH_BG)
         painter.drawRoundedRect(track, 3, 3)
 
         if self._duration <= 0:
             return
 
         # Selection range
-        start_x = self._time_to_x(self._start)
-        end_x = self._time_to_x(self._end)
-        sel_rect = QRectF(min(start_x, end_x), track.top(), abs(end_x - start_x), track.height())
-        painter.setBrush(QColor("#0078d4"))
+        start_x, end_x = self._handle_xs()
+        sel_rect = self._sel_rect
+        sel_rect.setRect(min(start_x, end_x), track.top(), abs(end_x - start_x), track.height())
+        painter.setBrush(self._BRUSH_SEL)
         painter.drawRoundedRect(sel_rect, 3, 3)
 
-        # Handles
+        # Handles (axis-aligned, no antialiasing needed)
+        painter.setRenderHint(QPainter.Antialiasing, False)
         handle_w = 6
         handle_h = track.height() + 10
         handle_y = track.center().y() - handle_h / 2
-        painter.setBrush(QColor("#e6e6e6"))
-        painter.setPen(Qt.NoPen)
-        painter.drawRect(QRectF(start_x - handle_w / 2, handle_y, handle_w, handle_h))
-        painter.drawRect(QRectF(end_x - handle_w / 2, handle_y, handle_w, handle_h))
+        painter.setBrush(self._BRUSH_HANDLE)
+        handle_rect = self._handle_rect
+        handle_rect.setRect(start_x - handle_w / 2, handle_y, handle_w, handle_h)
+        painter.drawRect(handle_rect)
+        handle_rect.setRect(end_x - handle_w / 2, handle_y, handle_w, handle_h)
+        painter.drawRect(handle_rect)
 
         # Current position marker
         cur_x = self._time_to_x(self._current)
-        pen = QPen(QColor("#ffffff"))
-        pen.setWidth(1)
-        painter.setPen(pen)
+        painter.setPen(self._PEN_CURRENT)
         painter.drawLine(int(cur_x), int(track.top() - 4), int(cur_x), int(track.bottom() + 4))
 
     def mousePressEvent(self, event):
         if self._duration <= 0 or event.button() != Qt.LeftButton:
             return
 
-        pos_x = event.position().x()
+        pos = event.position()
+        pos_x = pos.x()
         
         # 首先检查是否点击了滑块
-        start_x = self._time_to_x(self._start)
-        end_x = self._time_to_x(self._end)
+        start_x, end_x = self._handle_xs()
         handle_hit = 12
 
         # 检查滑块点击
@@ -124,8 +153,7 @@ class RangeSelector(QWidget):
             return
         
         # 然后检查轨道区域
-        track = self._track_rect()
-        if not track.contains(event.position()):
+        if not self._track.contains(pos):
             return
 
         t = self._x_to_time(pos_x)
@@ -153,13 +181,21 @@ class RangeSelector(QWidget):
         pos_x = event.position().x()
         if not self._is_dragging:
             # Update cursor
-            start_x = self._time_to_x(self._start)
-            end_x = self._time_to_x(self._end)
+            start_x, end_x = self._handle_xs()
             handle_hit = 12
             if abs(pos_x - start_x) <= handle_hit or abs(pos_x - end_x) <= handle_hit:
-                self.setCursor(QCursor(Qt.SizeHorCursor))
+                zone = "handle"
             elif min(start_x, end_x) <= pos_x <= max(start_x, end_x):
-                self.setCursor(QCursor(Qt.SizeAllCursor))
+                zone = "range"
+            else:
+                zone = None
+            if zone == self._hover_zone:
+                return
+            self._hover_zone = zone
+            if zone == "handle":
+                self.setCursor(self._HOR_CURSOR)
+            elif zone == "range":
+                self.setCursor(self._ALL_CURSOR)
             else:
                 self.unsetCursor()
             return
@@ -168,11 +204,13 @@ class RangeSelector(QWidget):
         if self._drag_mode == "left":
             self._set_start(t)
             self._current = self._start
-            self.seek_requested.emit(self._current)
+            self._emit_seek_on_release = True
+            self.preview_requested.emit(self._current)
         elif self._drag_mode == "right":
             self._set_end(t)
             self._current = self._end
-            self.seek_requested.emit(self._current)
+            self._emit_seek_on_release = True
+            self.preview_requested.emit(self._current)
         elif self._drag_mode == "range":
             offset = t - self._drag_anchor_time
             self._move_range(offset)
@@ -182,29 +220,58 @@ class RangeSelector(QWidget):
     def mouseReleaseEvent(self, event):
         if self._is_dragging and event.button() == Qt.LeftButton:
             self._is_dragging = False
+            # 松开时同步发送最终区间
+            self._emit_timer.stop()
+            self._flush_range_changed()
             if self._emit_seek_on_release:
                 self.seek_requested.emit(self._current)
             self._emit_seek_on_release = False
             self._drag_mode = None
 
-    def _track_rect(self) -> QRectF:
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_track_rect()
+
+    def _schedule_range_changed(self):
+        self._range_changed_pending = True
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    def _flush_range_changed(self):
+        if self._range_changed_pending:
+            self._range_changed_pending = False
+            self.range_changed.emit(self._start, self._end)
+
+    def _update_track_rect(self):
         margin = 8
         height = 8
         y = (self.height() - height) / 2
-        return QRectF(margin, y, max(0.0, self.width() - margin * 2), height)
+        track_w = max(0.0, self.width() - margin * 2)
+        self._track = QRectF(margin, y, track_w, height)
+        self._track_left = float(margin)
+        self._track_w = track_w
+        self._inv_track_w = 1.0 / track_w if track_w > 0 else 0.0
+
+    def _handle_xs(self) -> Tuple[float, float]:
+        """一次性计算左右手柄的 x 坐标"""
+        left = self._track_left
+        if self._duration <= 0 or self._track_w <= 0:
+            return left, left
+        scale = self._inv_duration * self._track_w
+        start_x = left + max(0.0, min(self._track_w, self._start * scale))
+        end_x = left + max(0.0, min(self._track_w, self._end * scale))
+        return start_x, end_x
 
     def _time_to_x(self, t: float) -> float:
-        track = self._track_rect()
-        if self._duration <= 0 or track.width() <= 0:
-            return track.left()
-        ratio = max(0.0, min(1.0, t / self._duration))
-        return track.left() + ratio * track.width()
+        if self._duration <= 0 or self._track_w <= 0:
+            return self._track_left
+        ratio = max(0.0, min(1.0, t * self._inv_duration))
+        return self._track_left + ratio * self._track_w
 
     def _x_to_time(self, x: float) -> float:
-        track = self._track_rect()
-        if self._duration <= 0 or track.width() <= 0:
+        if self._duration <= 0 or self._track_w <= 0:
             return 0.0
-        ratio = (x - track.left()) / track.width()
+        ratio = (x - self._track_left) * self._inv_track_w
         t = ratio * self._duration
         return self._snap_time(t)
 
@@ -233,7 +300,7 @@ class RangeSelector(QWidget):
         max_start = self._end - self._min_range if self._min_range > 0 else self._end
         start = max(0.0, min(start, max_start))
         self._start = start
-        self.range_changed.emit(self._start, self._end)
+        self._schedule_range_changed()
         self.update()
 
     def _set_end(self, end: float):
@@ -241,7 +308,7 @@ class RangeSelector(QWidget):
         min_end = self._start + self._min_range if self._min_range > 0 else self._start
         end = max(min_end, min(end, self._duration))
         self._end = end
-        self.range_changed.emit(self._start, self._end)
+        self._schedule_range_changed()
         self.update()
 
     def _move_range(self, offset: float):
@@ -257,7 +324,7 @@ class RangeSelector(QWidget):
         new_end = new_start + length
         self._start = new_start
         self._end = new_end
-        self.range_changed.emit(self._start, self._end)
+        self._schedule_range_changed()
         self.update()
 
     def _set_range_create(self, anchor: float, t: float):
@@ -265,7 +332,7 @@ class RangeSelector(QWidget):
         self._start = start
         self._end = end
         self._current = self._snap_time(t)
-        self.range_changed.emit(self._start, self._end)
+        self._schedule_range_changed()
         self.update()
 
 
@@ -274,6 +341,7 @@ class FrameTimeline(QWidget):
     
     range_changed = Signal(float, float)  # start_time, end_time
     seek_requested = Signal(float)
+    preview_requested = Signal(float)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -293,6 +361,7 @@ class FrameTimeline(QWidget):
         self.start_spin.setRange(0, 0)
         self.start_spin.setDecimals(3)
         self.start_spin.setSuffix(" 秒")
+        self.start_spin.setKeyboardTracking(False)
         self.start_spin.valueChanged.connect(self._on_start_changed)
         self.start_spin.setEnabled(False)  # 禁用输入，使用范围选择器
         start_layout.addWidget(self.start_spin, 1)
@@ -305,6 +374,7 @@ class FrameTimeline(QWidget):
         self.end_spin.setRange(0, 0)
         self.end_spin.setDecimals(3)
         self.end_spin.setSuffix(" 秒")
+        self.end_spin.setKeyboardTracking(False)
         self.end_spin.valueChanged.connect(self._on_end_changed)
         self.end_spin.setEnabled(False)  # 禁用输入，使用范围选择器
         end_layout.addWidget(self.end_spin, 1)
@@ -314,6 +384,7 @@ class FrameTimeline(QWidget):
         self.range_selector = RangeSelector()
         self.range_selector.range_changed.connect(self._on_selector_range_changed)
         self.range_selector.seek_requested.connect(self.seek_requested.emit)
+        self.range_selector.preview_requested.connect(self.preview_requested.emit)
         layout.addWidget(self.range_selector)
 
         # Duration display
@@ -342,6 +413,14 @@ class FrameTimeline(QWidget):
     def set_fps(self, fps: float):
         self._fps = max(0.0, fps)
         self.range_selector.set_fps(self._fps)
+        if self._fps > 0:
+            # 步长与吸附间隔一致，避免 微调→吸附→回写 的往返；
+            # get_range 从输入框读回，小数位要能表示一帧的步长（至少保留到毫秒）
+            step = 1.0 / self._fps
+            decimals = max(3, int(math.ceil(math.log10(self._fps))) + 1)
+            for spin in (self.start_spin, self.end_spin):
+                spin.setDecimals(decimals)
+                spin.setSingleStep(step)
     
     def get_range(self) -> Tuple[float, float]:
         """获取时间范围"""
@@ -350,15 +429,20 @@ class FrameTimeline(QWidget):
     def set_range(self, start: float, end: float):
         """设置时间范围"""
         start, end = self._normalize_range(start, end)
-        self.start_spin.blockSignals(True)
-        self.end_spin.blockSignals(True)
-        self.start_spin.setValue(start)
-        self.end_spin.setValue(end)
-        self.start_spin.blockSignals(False)
-        self.end_spin.blockSignals(False)
-
-        self.range_selector.set_range(start, end, emit=False)
-        self._update_duration_label()
+        # 合并多个子控件的更新为一次重绘
+        self.setUpdatesEnabled(False)
+        try:
+            self.start_spin.blockSignals(True)
+            self.end_spin.blockSignals(True)
+            self.start_spin.setValue(start)
+            self.end_spin.setValue(end)
+            self.start_spin.blockSignals(False)
+            self.end_spin.blockSignals(False)
+
+            self.range_selector.set_range(start, end, emit=False)
+            self._update_duration_label()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def set_current_position(self, position: float):
         self.range_selector.set_current_position(position)
@@ -382,13 +466,18 @@ class FrameTimeline(QWidget):
         self.range_changed.emit(self.start_spin.value(), self.end_spin.value())
 
     def _on_selector_range_changed(self, start: float, end: float):
-        self.start_spin.blockSignals(True)
-        self.end_spin.blockSignals(True)
-        self.start_spin.setValue(start)
-        self.end_spin.setValue(end)
-        self.start_spin.blockSignals(False)
-        self.end_spin.blockSignals(False)
-        self._update_duration_label()
+        # 拖动区间时每次移动都会触发，合并子控件更新为一次重绘
+        self.setUpdatesEnabled(False)
+        try:
+            self.start_spin.blockSignals(True)
+            self.end_spin.blockSignals(True)
+            self.start_spin.setValue(start)
+            self.end_spin.setValue(end)
+            self.start_spin.blockSignals(False)
+            self.end_spin.blockSignals(False)
+            self._update_duration_label()
+        finally:
+            self.setUpdatesEnabled(True)
         self.range_changed.emit(start, end)
 
     def _snap_time(self, t: float) -> float:
@@ -14,7 +14,9 @@ from PySide6.QtGui import (
 )
 
 from src.core.magic_wand import MagicWand, clean_small_regions, grow_selection, shrink_selection
-from src.utils.image_utils import numpy_to_qpixmap
+from src.utils.image_utils import (
+    numpy_to_qpixmap, create_checkerboard, blend_over_background, blend_over_color
+)
 
 
 @dataclass
@@ -67,21 +69,6 @@ class EditorHistory:
         self._current_index = -1
 
 
-def create_checkerboard_fast(width: int, height: int, square_size: int = 10) -> np.ndarray:
-    """快速创建棋盘格背景 - NumPy向量化"""
-    board = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    y_coords, x_coords = np.ogrid[:height, :width]
-    grid_x = x_coords // square_size
-    grid_y = y_coords // square_size
-    use_color1 = ((grid_x + grid_y) % 2 == 0)
-    
-    board[use_color1] = [200, 200, 200]
-    board[~use_color1] = [255, 255, 255]
-    
-    return board
-
-
 class ImageCanvas(QWidget):
     """图像画布 - 性能优化版"""
     
@@ -107,8 +94,6 @@ class ImageCanvas(QWidget):
         self._offset_x = 0
         self._offset_y = 0
         
-        self._checkerboard_cache: Optional[np.ndarray] = None
-        
         self.setMouseTracking(True)
         self.setFocusPolicy(Qt.StrongFocus)
         self.setMinimumSize(400, 300)
@@ -162,22 +147,17 @@ class ImageCanvas(QWidget):
     def _composite_background(self, image: np.ndarray) -> np.ndarray:
         """根据背景模式合成背景"""
         h, w = image.shape[:2]
-        alpha = image[:, :, 3:4] / 255.0
-        rgb = image[:, :, :3]
         
+        # 整数 alpha 混合，不经过浮点中间数组
         if self._bg_mode == "checkerboard":
-            if self._checkerboard_cache is None or self._checkerboard_cache.shape[:2] != (h, w):
-                self._checkerboard_cache = create_checkerboard_fast(w, h)
-            bg = self._checkerboard_cache
+            # 共享的 LRU 缓存棋盘格(只读)
+            return blend_over_background(image, create_checkerboard(w, h))
         elif self._bg_mode == "white":
-            bg = np.full((h, w, 3), 255, dtype=np.uint8)
+            return blend_over_color(image, (255, 255, 255))
         elif self._bg_mode == "black":
-            bg = np.full((h, w, 3), 0, dtype=np.uint8)
+            return blend_over_color(image, (0, 0, 0))
         else:
-            bg = np.full((h, w, 3), 128, dtype=np.uint8)
-        
-        result = (rgb * alpha + bg * (1 - alpha)).astype(np.uint8)
-        return result
+            return blend_over_color(image, (128, 128, 128))
     
     def _fit_to_view(self):
         if self._display_pixmap is None:
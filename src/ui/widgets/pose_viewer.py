@@ -1,7 +1,7 @@
 """姿势骨架可视化控件"""
 from typing import Optional
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import QPixmap
 import numpy as np
 
@@ -17,6 +17,14 @@ class PoseViewer(QWidget):
         super().__init__(parent)
         self._image: Optional[np.ndarray] = None
         self._pose: Optional[PoseData] = None
+        self._annotated_pixmap: Optional[QPixmap] = None  # 已绘制骨架的原尺寸图，缩放时复用
+        self._scaled_size: Optional[QSize] = None  # 标签上当前 pixmap 对应的尺寸，None 表示需重新缩放
+        self._scaled_smooth = False  # 标签上当前 pixmap 是否为平滑缩放
+        # 拖动调整大小时先快速缩放，尺寸稳定 120ms 后再平滑缩放
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(120)
+        self._smooth_timer.timeout.connect(self._update_display)
         self._detector = PoseDetector()
         
         self.setup_ui()
@@ -50,11 +58,13 @@ class PoseViewer(QWidget):
     def set_image(self, image: np.ndarray):
         """设置图像"""
         self._image = image
+        self._render_annotated()
         self._update_display()
     
     def set_pose(self, pose: Optional[PoseData]):
         """设置姿势数据"""
         self._pose = pose
+        self._render_annotated()
         self._update_display()
         self._update_info()
     
@@ -62,6 +72,7 @@ class PoseViewer(QWidget):
         """同时设置图像和姿势"""
         self._image = image
         self._pose = pose
+        self._render_annotated()
         self._update_display()
         self._update_info()
     
@@ -69,13 +80,14 @@ class PoseViewer(QWidget):
         """清空显示"""
         self._image = None
         self._pose = None
+        self._annotated_pixmap = None
         self.image_label.clear()
         self.info_label.setText("未检测到姿势")
     
-    def _update_display(self):
-        """更新显示"""
+    def _render_annotated(self):
+        """绘制姿势骨架并缓存为 QPixmap（仅在图像或姿势变化时调用）"""
         if self._image is None:
-            self.image_label.clear()
+            self._annotated_pixmap = None
             return
         
         # 绘制姿势骨架
@@ -89,12 +101,24 @@ class PoseViewer(QWidget):
                 thickness=2
             )
         
-        # 转换为QPixmap并显示
-        pixmap = numpy_to_qpixmap(display_image)
-        scaled = pixmap.scaled(
-            self.image_label.size(),
+        self._annotated_pixmap = numpy_to_qpixmap(display_image)
+        self._scaled_size = None
+    
+    def _update_display(self, smooth: bool = True):
+        """更新显示（只缩放已缓存的 pixmap）"""
+        if self._annotated_pixmap is None:
+            self.image_label.clear()
+            return
+        
+        size = self.image_label.size()
+        if size == self._scaled_size and (self._scaled_smooth or not smooth):
+            return
+        self._scaled_size = size
+        self._scaled_smooth = smooth
+        scaled = self._annotated_pixmap.scaled(
+            size,
             Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
+            Qt.SmoothTransformation if smooth else Qt.FastTransformation
         )
         self.image_label.setPixmap(scaled)
     
@@ -103,10 +127,11 @@ class PoseViewer(QWidget):
         if self._pose is None:
             self.info_label.setText("未检测到姿势")
         else:
-            visible_count = sum(1 for lm in self._pose.landmarks if lm.visibility > 0.5)
+            visible_count = int(np.count_nonzero(self._pose.visibility_array > 0.5))
             confidence = self._pose.confidence * 100
             self.info_label.setText(f"检测到 {visible_count}/33 个关键点 | 置信度: {confidence:.1f}%")
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._update_display()
+        self._update_display(smooth=False)
+        self._smooth_timer.start()
@@ -5,20 +5,82 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QSlider, QStyle, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QThread, QObject
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread, QObject, QSize, QElapsedTimer
+from PySide6.QtGui import QPixmap, QImage
 import numpy as np
+import threading
 import time
 
 from src.core.video_processor import VideoProcessor
 from src.models.frame_data import VideoInfo
-from src.utils.image_utils import numpy_to_qpixmap
+from src.utils.image_utils import numpy_to_qpixmap, numpy_to_qimage
+
+
+class _DecodeWorker(QObject):
+    """后台解码器 - 在独立线程中解码并缩放帧，只处理最新一次请求"""
+    
+    # generation, frame_number, frame, is_bgr, 缩放后的图像, 缩放目标尺寸, 是否平滑缩放
+    frame_ready = Signal(int, int, object, bool, QImage, QSize, bool)
+    
+    def __init__(self, processor: VideoProcessor):
+        super().__init__()
+        self._processor = processor
+        # 缓存命中率统计，取帧时顺带得到，无需额外查询缓存；读写都在 _lock 内进行
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._lock = threading.Lock()
+        self._pending: Optional[tuple] = None  # (generation, timestamp, frame_number, size, smooth)
+    
+    def set_request(self, generation: int, timestamp: float, frame_number: int, size: QSize, smooth: bool):
+        """记录最新的解码请求(GUI 线程调用)，旧的未处理请求被覆盖"""
+        with self._lock:
+            self._pending = (generation, timestamp, frame_number, size, smooth)
+    
+    def get_cache_stats(self) -> tuple:
+        """返回 (命中次数, 未命中次数)，GUI 线程调用"""
+        with self._lock:
+            return self._cache_hits, self._cache_misses
+    
+    def reset_cache_stats(self):
+        """清零缓存命中统计，GUI 线程调用"""
+        with self._lock:
+            self._cache_hits = 0
+            self._cache_misses = 0
+    
+    @Slot()
+    def process(self):
+        with self._lock:
+            request = self._pending
+            self._pending = None
+        if request is None:
+            return
+        generation, timestamp, frame_number, size, smooth = request
+        frame, is_bgr, cache_hit = self._processor.get_display_frame_at(timestamp)
+        with self._lock:
+            if cache_hit:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        scaled = QImage()
+        if frame is not None and not size.isEmpty():
+            # 零拷贝包装只在本函数内使用，scaled() 产生独立的缩放结果
+            image = numpy_to_qimage(frame, copy=False, bgr=is_bgr)
+            scaled = image.scaled(
+                size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation if smooth else Qt.FastTransformation
+            )
+            if scaled.size() == image.size():
+                # 尺寸不变时 scaled() 返回共享数组内存的浅拷贝，需复制后才能跨线程发送
+                scaled = image.copy()
+        self.frame_ready.emit(generation, frame_number, frame, is_bgr, scaled, size, smooth)
 
 
 class VideoPlayer(QWidget):
     """视频播放器控件"""
     
     position_changed = Signal(float)  # 当前时间(秒)
+    _decode_requested = Signal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -30,11 +92,51 @@ class VideoPlayer(QWidget):
         self._range_start = 0.0
         self._range_end = 0.0
         self._play_timer = QTimer(self)
+        self._play_timer.setTimerType(Qt.PreciseTimer)  # 毫秒级精度，稳定播放节奏
         self._play_timer.timeout.connect(self._on_play_tick)
-        self._last_play_time = 0.0
+        # 拖动滑块时合并解码请求，每个间隔只显示最后一次位置
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(33)
+        self._seek_timer.timeout.connect(self._deferred_seek)
+        self._pending_seek: Optional[float] = None
+        self._total_time_str = self._format_time(0)  # 总时长文本，加载视频时计算一次
+        self._last_time_ms = -1  # 上次显示的当前时间(毫秒)
+        self._last_rendered_frame_idx = -1  # 当前已显示的帧号，同一帧内的位置变化无需重新解码
+        self._source_frame: Optional[tuple] = None  # 当前帧 (frame, is_bgr)
+        self._source_pixmap: Optional[QPixmap] = None  # 当前帧原尺寸 pixmap，仅在需要重新缩放时创建
+        self._scaled_pixmap: Optional[QPixmap] = None  # 按 _scaled_size 缩放后的 pixmap
+        self._scaled_size: Optional[QSize] = None
+        self._scaled_smooth = False  # _scaled_pixmap 是否为平滑缩放
+        # 拖动/播放时用快速缩放，停止操作 120ms 后再补一次平滑缩放
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(120)
+        self._smooth_timer.timeout.connect(self._on_smooth_timeout)
+        # 播放时钟基准：位置 = 起始位置 + 单调时钟经过时间，避免逐帧累加产生漂移
+        self._play_clock = QElapsedTimer()
+        self._play_start_pos = 0.0
+        self._last_preload_time: Optional[float] = None  # 上次触发预加载时的播放位置
+        self._render_pending = False  # 是否有已发出但尚未显示的渲染请求
+        self._last_render_ns = 0  # 上次显示帧的时刻(time.monotonic_ns)
+        self._frame_interval_ns = 0  # 视频一帧的时长(纳秒)
+        # 以下按视频缓存的常量在 load_video 中设置，播放 tick 中直接使用
+        self._fps = 0.0
+        self._duration = 0.0
+        self._last_frame = 0  # 最后一帧的帧号
+        self._preload_frames = 0  # 预加载窗口(5秒)对应的帧数
         self._frame_display_times = []
-        self._cache_hits = 0
-        self._cache_misses = 0
+        # 播放 tick 发出的渲染请求 (帧号, 发出时刻 perf_counter)，帧显示后据此记录端到端耗时
+        self._display_request: Optional[tuple] = None
+        
+        # 未命中缓存的帧在后台线程解码，避免阻塞界面
+        self._decode_generation = 0  # 每次加载视频递增，丢弃旧视频的解码结果
+        self._decode_thread = QThread(self)
+        self._decode_worker = _DecodeWorker(self._processor)
+        self._decode_worker.moveToThread(self._decode_thread)
+        self._decode_requested.connect(self._decode_worker.process)
+        self._decode_worker.frame_ready.connect(self._apply_frame)
+        self._decode_thread.start()
         
         self.setup_ui()
     
@@ -104,6 +206,16 @@ class VideoPlayer(QWidget):
         try:
             self._video_info = self._processor.load_video(path)
             self._current_position = 0.0
+            self._last_rendered_frame_idx = -1
+            self._decode_generation += 1
+            self._render_pending = False
+            self._fps = self._video_info.fps
+            self._duration = self._video_info.duration
+            self._last_frame = self._video_info.frame_count - 1
+            self._preload_frames = int(5.0 * self._fps)  # 预加载5秒
+            self._frame_interval_ns = int(1e9 / max(1.0, self._fps))
+            self._total_time_str = self._format_time(int(self._duration * 1000))
+            self._last_time_ms = -1
             self._update_time_label()
             self._show_frame_at(0.0)
             # 开始预加载线程
@@ -138,7 +250,7 @@ class VideoPlayer(QWidget):
     def _clamp_playback_range(self):
         if not self._video_info:
             return
-        duration = self._video_info.duration
+        duration = self._duration
         self._range_start = max(0.0, min(self._range_start, duration))
         self._range_end = max(0.0, min(self._range_end, duration))
         if self._range_end < self._range_start:
@@ -159,21 +271,15 @@ class VideoPlayer(QWidget):
             self._clamp_playback_range()
             self.seek(self._range_start)
         
-        # 计算预加载范围：从当前位置开始，预加载5秒的帧
-        current_frame = int(self._current_position * self._video_info.fps)
-        preload_duration = 5.0  # 预加载5秒
-        preload_frames = int(preload_duration * self._video_info.fps)
-        end_frame = min(current_frame + preload_frames, self._video_info.frame_count - 1)
-        
         # 开始预加载
-        self._processor.preload_range(current_frame, end_frame)
+        self._preload_ahead()
         
         self._is_playing = True
         self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
-        self._last_play_time = time.time()
+        self._reset_play_clock()
         
         # 根据视频实际帧率设置定时器间隔
-        frame_interval = int(1000 / self._video_info.fps)
+        frame_interval = int(round(1000.0 / max(1.0, self._fps)))
         self._play_timer.start(max(16, frame_interval))  # 最少16ms，约60fps
     
     def pause(self):
@@ -181,42 +287,117 @@ class VideoPlayer(QWidget):
         self._is_playing = False
         self.play_btn.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
         self._play_timer.stop()
+        # 播放期间为快速缩放，暂停后补一次平滑缩放
+        self._smooth_timer.start()
     
     def seek(self, position: float):
         """跳转到指定位置"""
         if not self._video_info:
             return
         
-        position = max(0, min(position, self._video_info.duration))
+        position = max(0, min(position, self._duration))
         self._current_position = position
+        self._reset_play_clock()
+        self._last_preload_time = None  # 跳转后下一次播放 tick 从新位置预加载
         self._show_frame_at(position)
         self._update_slider()
         self._update_time_label()
         self.position_changed.emit(position)
     
-    def _show_frame_at(self, timestamp: float):
-        """显示指定时间的帧"""
-        # 计算帧号，用于缓存命中率统计
-        frame_number = int(timestamp * self._video_info.fps)
-        
-        # 检查缓存是否命中
-        cache_hit = False
-        with self._processor._lock:
-            if frame_number in self._processor._frame_cache:
-                cache_hit = True
-                self._cache_hits += 1
-            else:
-                self._cache_misses += 1
+    def preview_position(self, position: float):
+        """仅更新滑块和时间显示，不解码帧（拖动区间手柄时使用）"""
+        if not self._video_info:
+            return
+        self._current_position = max(0, min(position, self._duration))
+        if not self._slider_dragging:
+            self._update_slider()
+        self._update_time_label()
+    
+    def _show_frame_at(self, timestamp: float) -> bool:
+        """显示指定时间的帧，返回是否发出了新的解码请求"""
+        # 计算帧号，同一帧内的位置变化无需重新解码
+        frame_number = int(timestamp * self._fps)
+        if frame_number == self._last_rendered_frame_idx:
+            return False
         
-        frame = self._processor.get_frame_at(timestamp)
-        if frame is not None:
-            pixmap = numpy_to_qpixmap(frame)
-            scaled = pixmap.scaled(
-                self.video_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.video_label.setPixmap(scaled)
+        self._last_rendered_frame_idx = frame_number
+        self._render_pending = True
+        # 解码、格式转换和缩放都在后台线程完成，界面线程只接收缩放好的图像
+        self._decode_worker.set_request(
+            self._decode_generation, timestamp, frame_number,
+            self.video_label.size(), not (self._slider_dragging or self._is_playing)
+        )
+        self._decode_requested.emit()
+        return True
+    
+    def _apply_frame(self, generation: int, frame_number: int, frame, is_bgr: bool,
+                     scaled: QImage, size: QSize, smooth: bool):
+        """在界面线程中显示后台线程解码并缩放好的帧"""
+        if generation != self._decode_generation:
+            return
+        if frame_number == self._last_rendered_frame_idx:
+            self._render_pending = False
+        self._last_render_ns = time.monotonic_ns()
+        request = self._display_request
+        if request is not None and request[0] == frame_number:
+            self._display_request = None
+        else:
+            request = None
+        if frame is None:
+            # 解码失败，允许之后重试同一帧
+            if frame_number == self._last_rendered_frame_idx:
+                self._last_rendered_frame_idx = -1
+            return
+        self._source_frame = (frame, is_bgr)
+        self._source_pixmap = None
+        if scaled.isNull():
+            self._scaled_pixmap = None
+        else:
+            # scaled 由后台线程新建且独占像素，可直接转入 QPixmap，省去一次复制
+            self._scaled_pixmap = QPixmap.fromImageInPlace(scaled)
+            self._scaled_size = size
+            self._scaled_smooth = smooth
+            self.video_label.setPixmap(self._scaled_pixmap)
+        # 标签尺寸在解码期间发生变化时在此补做缩放
+        self._update_scaled_pixmap()
+        if request is not None:
+            # 记录从播放 tick 发出请求到帧显示出来的耗时（含后台解码和缩放）
+            self._frame_display_times.append(time.perf_counter() - request[1])
+            if len(self._frame_display_times) > 100:
+                self._frame_display_times.pop(0)
+    
+    def _update_scaled_pixmap(self):
+        """按标签尺寸显示当前帧，帧和尺寸都未变化时复用上次的缩放结果"""
+        if self._source_frame is None:
+            return
+        smooth = not (self._slider_dragging or self._is_playing)
+        size = self.video_label.size()
+        if (self._scaled_pixmap is not None and size == self._scaled_size
+                and (self._scaled_smooth or not smooth)):
+            return
+        if self._source_pixmap is None:
+            frame, is_bgr = self._source_frame
+            self._source_pixmap = numpy_to_qpixmap(frame, bgr=is_bgr)
+        self._scaled_pixmap = self._source_pixmap.scaled(
+            size,
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation if smooth else Qt.FastTransformation
+        )
+        self._scaled_size = size
+        self._scaled_smooth = smooth
+        self.video_label.setPixmap(self._scaled_pixmap)
+        if not smooth:
+            self._smooth_timer.start()
+    
+    def _on_smooth_timeout(self):
+        """交互停止后以平滑缩放重新显示当前帧"""
+        if self._slider_dragging or self._is_playing:
+            return
+        self._update_scaled_pixmap()
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scaled_pixmap()
     
     def get_performance_stats(self):
         """获取性能统计信息"""
@@ -225,63 +406,53 @@ class VideoPlayer(QWidget):
         else:
             avg_display_time = sum(self._frame_display_times) / len(self._frame_display_times)
         
-        total_accesses = self._cache_hits + self._cache_misses
-        hit_rate = (self._cache_hits / total_accesses * 100) if total_accesses > 0 else 0
+        cache_hits, cache_misses = self._decode_worker.get_cache_stats()
+        total_accesses = cache_hits + cache_misses
+        hit_rate = (cache_hits / total_accesses * 100) if total_accesses > 0 else 0
         
         return {
             'average_frame_display_time': avg_display_time,
             'cache_hit_rate': hit_rate,
-            'cache_hits': self._cache_hits,
-            'cache_misses': self._cache_misses
+            'cache_hits': cache_hits,
+            'cache_misses': cache_misses
         }
     
     def reset_performance_stats(self):
         """重置性能统计信息"""
         self._frame_display_times.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        self._display_request = None
+        self._decode_worker.reset_cache_stats()
     
     def _on_play_tick(self):
         """播放定时器回调"""
         if not self._video_info:
             return
 
-        # 计算实际经过的时间，使播放速度更加准确
-        current_time = time.time()
-        elapsed = current_time - self._last_play_time
-        self._last_play_time = current_time
+        # 按单调时钟计算当前位置（整数纳秒，仅在此换算为秒），定时器抖动不会累积
+        elapsed_ns = self._play_clock.nsecsElapsed()
+        self._current_position = self._play_start_pos + elapsed_ns * 1e-9
 
         if self._range_playback_enabled:
             self._clamp_playback_range()
             if self._current_position < self._range_start:
                 self._current_position = self._range_start
+                self._reset_play_clock()
             range_end = self._range_end
         else:
-            range_end = self._video_info.duration
-
-        # 根据实际帧率前进
-        frame_duration = 1.0 / self._video_info.fps
-        self._current_position += frame_duration
+            range_end = self._duration
 
         # 持续预加载：每播放1秒，预加载后续5秒的帧
-        current_frame = int(self._current_position * self._video_info.fps)
-        if current_frame % int(self._video_info.fps) == 0:  # 每秒预加载一次
-            preload_duration = 5.0  # 预加载5秒
-            preload_frames = int(preload_duration * self._video_info.fps)
-            end_frame = min(current_frame + preload_frames, self._video_info.frame_count - 1)
-            self._processor.preload_range(current_frame, end_frame)
+        if (self._last_preload_time is None
+                or self._current_position - self._last_preload_time >= 1.0):
+            self._preload_ahead()
 
         if self._range_playback_enabled:
             if self._current_position >= range_end:
                 # 循环播放：重置到区间开始位置
                 self._current_position = self._range_start
-                # 记录帧显示时间
-                start_time = time.time()
-                self._show_frame_at(self._current_position)
-                display_time = time.time() - start_time
-                self._frame_display_times.append(display_time)
-                if len(self._frame_display_times) > 100:
-                    self._frame_display_times.pop(0)
+                self._reset_play_clock()
+                self._last_preload_time = None
+                self._present_tick_frame()
                 
                 if not self._slider_dragging:
                     self._update_slider()
@@ -289,60 +460,101 @@ class VideoPlayer(QWidget):
                 self.position_changed.emit(self._current_position)
                 return
         else:
-            if self._current_position >= self._video_info.duration:
+            if self._current_position >= self._duration:
                 self._current_position = 0.0  # 循环
+                self._reset_play_clock()
+                self._last_preload_time = None
 
-        # 记录帧显示时间
-        start_time = time.time()
-        self._show_frame_at(self._current_position)
-        display_time = time.time() - start_time
-        self._frame_display_times.append(display_time)
-        if len(self._frame_display_times) > 100:
-            self._frame_display_times.pop(0)
+        self._present_tick_frame()
 
         if not self._slider_dragging:
             self._update_slider()
         self._update_time_label()
         self.position_changed.emit(self._current_position)
 
+    def _present_tick_frame(self):
+        """播放 tick 中显示当前帧；上一帧仍在后台渲染且距上次显示不足一帧时跳过"""
+        if (self._render_pending
+                and time.monotonic_ns() - self._last_render_ns < self._frame_interval_ns):
+            # 落后时只推进位置，不再追加渲染请求
+            return
+        # 记录请求发出时刻，帧显示时在 _apply_frame 中统计耗时
+        start_time = time.perf_counter()
+        if self._show_frame_at(self._current_position):
+            self._display_request = (self._last_rendered_frame_idx, start_time)
+
+    def _preload_ahead(self):
+        """从当前位置开始预加载5秒的帧，并记录触发位置"""
+        current_frame = int(self._current_position * self._fps)
+        end_frame = min(current_frame + self._preload_frames, self._last_frame)
+        self._processor.preload_range(current_frame, end_frame)
+        self._last_preload_time = self._current_position
+    
+    def _reset_play_clock(self):
+        """以当前位置和当前时刻重新设定播放时钟基准"""
+        self._play_clock.start()
+        self._play_start_pos = self._current_position
+
     def _on_slider_moved(self, value):
         """滑块移动"""
         if not self._video_info:
             return
         
-        position = (value / 1000.0) * self._video_info.duration
+        position = (value / 1000.0) * self._duration
         self._current_position = position
-        self._show_frame_at(position)
+        self._pending_seek = position
         self._update_time_label()
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+    
+    def _deferred_seek(self):
+        """显示拖动期间最后一次请求的位置"""
+        if self._pending_seek is None or not self._video_info:
+            return
+        position = self._pending_seek
+        self._pending_seek = None
+        self._show_frame_at(position)
     
     def _on_slider_pressed(self):
         self._slider_dragging = True
     
     def _on_slider_released(self):
         self._slider_dragging = False
+        # 松开时立即显示最终位置
+        self._seek_timer.stop()
+        self._deferred_seek()
+        self._reset_play_clock()
+        self._last_preload_time = None
+        self._smooth_timer.start()
         self.position_changed.emit(self._current_position)
     
     def _update_slider(self):
-        if not self._video_info or self._video_info.duration == 0:
+        if not self._video_info or self._duration == 0:
             return
-        value = int((self._current_position / self._video_info.duration) * 1000)
+        value = int((self._current_position / self._duration) * 1000)
         self.time_slider.blockSignals(True)
         self.time_slider.setValue(value)
         self.time_slider.blockSignals(False)
     
     def _update_time_label(self):
-        current = self._format_time(self._current_position)
-        total = self._format_time(self._video_info.duration if self._video_info else 0)
-        self.time_label.setText(f"{current} / {total}")
+        # 先按整数毫秒比较，未变化时不做格式化
+        ms = int(self._current_position * 1000)
+        if ms == self._last_time_ms:
+            return
+        self._last_time_ms = ms
+        self.time_label.setText(f"{self._format_time(ms)} / {self._total_time_str}")
     
     @staticmethod
-    def _format_time(seconds: float) -> str:
-        mins = int(seconds // 60)
-        secs = seconds % 60
-        return f"{mins:02d}:{secs:06.3f}"
+    def _format_time(ms: int) -> str:
+        """毫秒格式化为 mm:ss.mmm，全程整数运算"""
+        mins, ms = divmod(ms, 60000)
+        secs, ms = divmod(ms, 1000)
+        return f"{mins:02d}:{secs:02d}.{ms:03d}"
     
     def release(self):
         """释放资源"""
         self.pause()
+        self._decode_thread.quit()
+        self._decode_thread.wait()
         self._processor.stop_preload()  # 停止预加载线程
         self._processor.release()
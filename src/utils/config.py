@@ -1,7 +1,15 @@
 """配置管理"""
 from pathlib import Path
 from typing import Optional
+import atexit
 import json
+import sys
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
 
 
 class Config:
@@ -108,28 +116,72 @@ class Config:
     MAX_ZOOM = 32.0
     MIN_ZOOM = 0.1
     
+    SAVE_DELAY_MS = 500  # 属性修改后延迟保存，合并连续修改
+    
     def __init__(self, config_path: Optional[Path] = None):
         self._config_path = config_path or Path("config.json")
         self._data = {}
+        self._dirty = False  # 是否有尚未写入磁盘的修改
+        self._save_scheduled = False
         self._load()
+        # 退出前写入尚未保存的修改
+        atexit.register(self._flush)
     
     def _load(self):
         """加载配置"""
         if self._config_path.exists():
             try:
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
+                if _ORJSON_AVAILABLE:
+                    self._data = orjson.loads(self._config_path.read_bytes())
+                else:
+                    with open(self._config_path, 'r', encoding='utf-8') as f:
+                        self._data = json.load(f)
             except Exception:
                 self._data = {}
     
     def save(self):
         """保存配置"""
+        self._dirty = False
         try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
+            if _ORJSON_AVAILABLE:
+                self._config_path.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self._config_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, indent=2, ensure_ascii=False)
         except Exception:
             pass
     
+    def _schedule_save(self):
+        """标记修改并延迟保存
+        
+        只有在 Qt 主线程（有事件循环）中才延迟合并写入；
+        未使用 Qt 或在工作线程中调用时立即保存，避免定时器永远不触发。
+        """
+        self._dirty = True
+        if self._save_scheduled:
+            return
+        if not self._on_qt_main_thread():
+            self.save()
+            return
+        from PySide6.QtCore import QTimer
+        self._save_scheduled = True
+        QTimer.singleShot(self.SAVE_DELAY_MS, self._flush)
+    
+    @staticmethod
+    def _on_qt_main_thread() -> bool:
+        """当前是否在 Qt 应用的主线程中（本模块不主动导入 PySide6）"""
+        qtcore = sys.modules.get("PySide6.QtCore")
+        if qtcore is None:
+            return False
+        app = qtcore.QCoreApplication.instance()
+        return app is not None and qtcore.QThread.currentThread() == app.thread()
+    
+    def _flush(self):
+        """写入尚未保存的修改"""
+        self._save_scheduled = False
+        if self._dirty:
+            self.save()
+    
     def get(self, key: str, default=None):
         """获取配置值"""
         return self._data.get(key, default)
@@ -148,7 +200,7 @@ class Config:
     @last_video_dir.setter
     def last_video_dir(self, value: str):
         self.set("last_video_dir", value)
-        self.save()
+        self._schedule_save()
     
     @property
     def last_export_dir(self) -> str:
@@ -158,7 +210,7 @@ class Config:
     @last_export_dir.setter
     def last_export_dir(self, value: str):
         self.set("last_export_dir", value)
-        self.save()
+        self._schedule_save()
     
     @property
     def extract_fps(self) -> float:
@@ -168,7 +220,7 @@ class Config:
     @extract_fps.setter
     def extract_fps(self, value: float):
         self.set("extract_fps", value)
-        self.save()
+        self._schedule_save()
 
 
 # 全局配置实例
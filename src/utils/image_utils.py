@@ -2,15 +2,22 @@
 from typing import Optional, Tuple
 from functools import lru_cache
 import numpy as np
-from PIL import Image
+import cv2
 from PySide6.QtGui import QImage, QPixmap
 
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
 
-def numpy_to_qimage(array: np.ndarray) -> QImage:
-    """将numpy数组转换为QImage"""
-    if array is None:
-        return QImage()
+
+def _wrap_numpy_as_qimage(array: np.ndarray, bgr: bool = False) -> Tuple[QImage, np.ndarray]:
+    """用numpy缓冲区直接构造QImage(零拷贝)
     
+    返回的QImage引用数组内存，调用方需在使用期间持有返回的数组。
+    bgr=True 表示三通道数据为 OpenCV 的 BGR 顺序。
+    """
     # 确保数组是连续的
     if not array.flags['C_CONTIGUOUS']:
         array = np.ascontiguousarray(array)
@@ -19,27 +26,62 @@ def numpy_to_qimage(array: np.ndarray) -> QImage:
     
     if len(array.shape) == 2:
         # 灰度图
-        bytes_per_line = width
-        qimg = QImage(array.data, width, height, bytes_per_line, QImage.Format_Grayscale8)
+        fmt = QImage.Format_Grayscale8
     elif array.shape[2] == 3:
-        # RGB
-        bytes_per_line = 3 * width
-        qimg = QImage(array.data, width, height, bytes_per_line, QImage.Format_RGB888)
+        # RGB / BGR
+        fmt = QImage.Format_BGR888 if bgr else QImage.Format_RGB888
     elif array.shape[2] == 4:
         # RGBA
-        bytes_per_line = 4 * width
-        qimg = QImage(array.data, width, height, bytes_per_line, QImage.Format_RGBA8888)
+        fmt = QImage.Format_RGBA8888
     else:
+        return QImage(), array
+    
+    # 显式传入行跨度，奇数宽度的 RGB 行无需 4 字节对齐
+    qimg = QImage(array.data, width, height, array.strides[0], fmt)
+    return qimg, array
+
+
+def numpy_to_qimage(array: np.ndarray, copy: bool = True, bgr: bool = False) -> QImage:
+    """将numpy数组转换为QImage
+    
+    copy=False 时不复制像素，返回的 QImage 通过属性持有数组；仅适用于在当前线程内
+    同步使用的场景，不能跨线程传递或保存其 C++ 副本(例如通过排队信号发送)。
+    bgr=True 时三通道数据按 BGR 解释。
+    """
+    if array is None:
         return QImage()
     
+    qimg, buffer = _wrap_numpy_as_qimage(array, bgr)
+    if not copy:
+        qimg._keepalive = buffer
+        return qimg
+    
     # 返回副本，避免数据引用问题
     return qimg.copy()
 
 
-def numpy_to_qpixmap(array: np.ndarray) -> QPixmap:
-    """将numpy数组转换为QPixmap"""
-    qimage = numpy_to_qimage(array)
-    return QPixmap.fromImage(qimage)
+def numpy_to_qpixmap(array: np.ndarray, bgr: bool = False) -> QPixmap:
+    """将numpy数组转换为QPixmap（bgr=True 时三通道数据按 BGR 解释，无需先转换通道）"""
+    if array is None:
+        return QPixmap()
+    
+    # QPixmap.fromImage 会复制像素数据，中间的 QImage 无需再拷贝一份
+    qimg, buffer = _wrap_numpy_as_qimage(array, bgr)
+    pixmap = QPixmap.fromImage(qimg)
+    del qimg, buffer
+    return pixmap
+
+
+def ensure_uint8(image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """将非 uint8 图像量化为 uint8（浮点图按 [0, 1] 或 [0, 255] 范围处理）"""
+    if image is None or image.dtype == np.uint8:
+        return image
+    if np.issubdtype(image.dtype, np.floating):
+        scale = 255.0 if image.max() <= 1.0 else 1.0
+        return np.clip(image * scale + 0.5, 0, 255).astype(np.uint8)
+    if image.dtype == np.uint16:
+        return (image >> 8).astype(np.uint8)
+    return np.clip(image, 0, 255).astype(np.uint8)
 
 
 def qimage_to_numpy(qimage: QImage) -> np.ndarray:
@@ -49,11 +91,30 @@ def qimage_to_numpy(qimage: QImage) -> np.ndarray:
     width = qimage.width()
     height = qimage.height()
     
-    ptr = qimage.bits()
-    arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, width, 4))
+    # 已是 RGBA8888 时 convertToFormat 返回共享数据的浅拷贝，bits() 会触发一次深拷贝，
+    # constBits() 只读访问不会；按 bytesPerLine 取行，结果只在最后复制一次
+    ptr = qimage.constBits()
+    arr = np.frombuffer(ptr, dtype=np.uint8, count=qimage.sizeInBytes())
+    arr = arr.reshape((height, qimage.bytesPerLine()))[:, :width * 4].reshape((height, width, 4))
     return arr.copy()
 
 
+def _resize(image: np.ndarray, size: Tuple[int, int]) -> np.ndarray:
+    """cv2 缩放：缩小用 INTER_AREA，放大用 INTER_LANCZOS4"""
+    h, w = image.shape[:2]
+    if (w, h) == size:
+        return image.copy()
+    shrink = size[0] <= w and size[1] <= h
+    interpolation = cv2.INTER_AREA if shrink else cv2.INTER_LANCZOS4
+    return cv2.resize(image, size, interpolation=interpolation)
+
+
+def _fit_size(width: int, height: int, max_w: int, max_h: int) -> Tuple[int, int]:
+    """保持宽高比缩小到 max_w x max_h 以内（不放大）"""
+    scale = min(max_w / width, max_h / height, 1.0)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
 def resize_image(
     image: np.ndarray,
     target_size: Tuple[int, int],
@@ -67,23 +128,28 @@ def resize_image(
         target_size: 目标尺寸 (width, height)
         keep_aspect: 是否保持宽高比
     """
-    pil_image = Image.fromarray(image)
-    
-    if keep_aspect:
-        pil_image.thumbnail(target_size, Image.Resampling.LANCZOS)
-        # 创建目标尺寸的背景
-        result = Image.new('RGBA', target_size, (0, 0, 0, 0))
-        # 居中粘贴
-        offset = ((target_size[0] - pil_image.width) // 2,
-                  (target_size[1] - pil_image.height) // 2)
-        if pil_image.mode == 'RGBA':
-            result.paste(pil_image, offset, pil_image)
-        else:
-            result.paste(pil_image, offset)
-        return np.array(result)
+    if not keep_aspect:
+        return _resize(image, target_size)
+    
+    h, w = image.shape[:2]
+    new_w, new_h = _fit_size(w, h, *target_size)
+    resized = _resize(image, (new_w, new_h))
+    
+    # 创建目标尺寸的透明背景并居中放置
+    target_w, target_h = target_size
+    result = np.zeros((target_h, target_w, 4), dtype=np.uint8)
+    x = (target_w - new_w) // 2
+    y = (target_h - new_h) // 2
+    region = result[y:y + new_h, x:x + new_w]
+    if resized.ndim == 2:
+        region[:, :, :3] = resized[:, :, np.newaxis]
+        region[:, :, 3] = 255
+    elif resized.shape[2] == 4:
+        region[:] = resized
     else:
-        resized = pil_image.resize(target_size, Image.Resampling.LANCZOS)
-        return np.array(resized)
+        region[:, :, :3] = resized
+        region[:, :, 3] = 255
+    return result
 
 
 def create_thumbnail(
@@ -91,12 +157,10 @@ def create_thumbnail(
     max_size: int = 128
 ) -> np.ndarray:
     """创建缩略图"""
-    pil_image = Image.fromarray(image)
-    pil_image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-    return np.array(pil_image)
+    h, w = image.shape[:2]
+    return _resize(image, _fit_size(w, h, max_size, max_size))
 
 
-@lru_cache(maxsize=32)
 def create_checkerboard(
     width: int,
     height: int,
@@ -104,39 +168,143 @@ def create_checkerboard(
     color1: Tuple[int, int, int] = (200, 200, 200),
     color2: Tuple[int, int, int] = (255, 255, 255)
 ) -> np.ndarray:
-    """创建棋盘格背景(用于显示透明图像) - 带缓存"""
-    board = np.zeros((height, width, 3), dtype=np.uint8)
-    
-    # 使用 numpy 向量化操作代替循环，大幅提升性能
-    # 创建坐标网格
-    y_coords, x_coords = np.ogrid[:height, :width]
-    # 计算每个格子是否使用 color1
-    grid_x = x_coords // square_size
-    grid_y = y_coords // square_size
-    use_color1 = ((grid_x + grid_y) % 2 == 0)
-    # 使用广播填充颜色
-    board[:] = np.where(use_color1[:, :, np.newaxis], color1, color2)
+    """创建棋盘格背景(用于显示透明图像) - 带缓存
+    
+    返回的数组在所有调用方之间共享，因此设为只读。
+    """
+    # 参数统一按位置传给缓存函数：lru_cache 按调用形式区分键，
+    # create_checkerboard(w, h) 与 create_checkerboard(w, h, 10) 否则会各占一个缓存项
+    return _create_checkerboard(int(width), int(height), int(square_size), tuple(color1), tuple(color2))
+
+
+@lru_cache(maxsize=8)
+def _create_checkerboard(
+    width: int,
+    height: int,
+    square_size: int,
+    color1: Tuple[int, int, int],
+    color2: Tuple[int, int, int]
+) -> np.ndarray:
+    # 行/列格子序号相加的奇偶性决定颜色，全程广播，无 Python 循环
+    grid_y = (np.arange(height) // square_size)[:, None]
+    grid_x = (np.arange(width) // square_size)[None, :]
+    use_color2 = ((grid_y + grid_x) & 1).astype(bool)
+    # 颜色直接用 uint8，避免 np.where 产生 int64 中间数组
+    board = np.where(
+        use_color2[:, :, np.newaxis],
+        np.array(color2, dtype=np.uint8),
+        np.array(color1, dtype=np.uint8)
+    )
+    board = np.ascontiguousarray(board)
+    board.setflags(write=False)
     
     return board
 
 
+# alpha 通道分类
+_ALPHA_MIXED = 0
+_ALPHA_OPAQUE = 1
+_ALPHA_TRANSPARENT = 2
+
+
+if _NUMBA_AVAILABLE:
+    # 缩略图在线程池中并发合成，因此用 nogil 单线程内核而非 parallel=True
+    # (numba 默认的 workqueue 线程层不支持多个线程同时调用并行内核)
+    @njit(cache=True, nogil=True)
+    def _blend_checker(image, checker, out):
+        """逐像素 uint8 alpha 混合: out = (fg*a + bg*(255-a)) / 255，四舍五入(bg 可为棋盘格或纯色)"""
+        h, w = out.shape[0], out.shape[1]
+        for i in range(h):
+            for j in range(w):
+                a = np.int32(image[i, j, 3])
+                inv = 255 - a
+                for c in range(3):
+                    t = np.int32(image[i, j, c]) * a + np.int32(checker[i, j, c]) * inv + 128
+                    out[i, j, c] = (t + (t >> 8)) >> 8
+    
+    @njit(cache=True, nogil=True)
+    def _classify_alpha_kernel(image):
+        """单次遍历 alpha，一旦同时出现非 255 与非 0 的值即提前返回"""
+        lo = 255
+        hi = 0
+        h, w = image.shape[0], image.shape[1]
+        for i in range(h):
+            for j in range(w):
+                a = image[i, j, 3]
+                if a < lo:
+                    lo = a
+                if a > hi:
+                    hi = a
+                if lo < 255 and hi > 0:
+                    return _ALPHA_MIXED
+        return _ALPHA_OPAQUE if lo == 255 else _ALPHA_TRANSPARENT
+
+
+def _classify_alpha(image: np.ndarray) -> int:
+    """判断 RGBA 图像是完全不透明、完全透明还是混合"""
+    if _NUMBA_AVAILABLE:
+        return _classify_alpha_kernel(image)
+    alpha = image[:, :, 3]
+    if alpha.min() == 255:
+        return _ALPHA_OPAQUE
+    if alpha.max() == 0:
+        return _ALPHA_TRANSPARENT
+    return _ALPHA_MIXED
+
+
 def composite_on_checkerboard(
     image: np.ndarray,
     square_size: int = 10
 ) -> np.ndarray:
-    """将带透明通道的图像合成到棋盘格背景上"""
+    """将带透明通道的图像合成到棋盘格背景上
+    
+    完全不透明时返回原图 RGB 视图，完全透明时返回共享的只读棋盘格，调用方不应原地修改结果。
+    """
     if image is None:
         return None
     
     if len(image.shape) != 3 or image.shape[2] != 4:
         return image
     
+    rgb = image[:, :, :3]
+    alpha_kind = _classify_alpha(image)
+    
+    # 完全不透明时无需合成
+    if alpha_kind == _ALPHA_OPAQUE:
+        return rgb
+    
     h, w = image.shape[:2]
     checkerboard = create_checkerboard(w, h, square_size)
     
-    # 使用alpha混合
-    alpha = image[:, :, 3:4] / 255.0
-    rgb = image[:, :, :3]
+    # 完全透明时直接返回(只读共享的)棋盘格
+    if alpha_kind == _ALPHA_TRANSPARENT:
+        return checkerboard
     
-    result = (rgb * alpha + checkerboard * (1 - alpha)).astype(np.uint8)
-    return result
+    return blend_over_background(image, checkerboard)
+
+
+def blend_over_background(image: np.ndarray, background: np.ndarray) -> np.ndarray:
+    """将 RGBA 图像按 alpha 混合到同尺寸的 RGB 背景上，全程 uint8/uint16 整数运算
+    
+    background 可以是只读数组或 np.broadcast_to 得到的纯色视图。
+    """
+    h, w = image.shape[:2]
+    if _NUMBA_AVAILABLE:
+        result = np.empty((h, w, 3), dtype=np.uint8)
+        _blend_checker(image, background, result)
+        return result
+    
+    # 无 numba 时用 OpenCV 的 SIMD 内核: (fg*a + bg*(255-a)) / 255 四舍五入
+    # 乘积之和不超过 255*255，uint16 足够；x/255 不会恰好落在 .5 上，舍入结果与整数内核一致
+    alpha = image[:, :, 3]
+    alpha3 = cv2.merge((alpha, alpha, alpha))
+    fg = cv2.multiply(np.ascontiguousarray(image[:, :, :3]), alpha3, dtype=cv2.CV_16U)
+    bg = cv2.multiply(np.ascontiguousarray(background), 255 - alpha3, dtype=cv2.CV_16U)
+    return cv2.convertScaleAbs(cv2.add(fg, bg), alpha=1.0 / 255.0)
+
+
+def blend_over_color(image: np.ndarray, color: Tuple[int, int, int]) -> np.ndarray:
+    """将 RGBA 图像合成到纯色背景上（不分配整幅背景数组）"""
+    h, w = image.shape[:2]
+    background = np.broadcast_to(np.array(color, dtype=np.uint8), (h, w, 3))
+    return blend_over_background(image, background)
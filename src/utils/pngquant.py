@@ -1,9 +1,13 @@
 """pngquant 压缩工具模块"""
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Tuple, Optional, List
 import os
 
+# 每次调用 pngquant 传入的最大文件数（同时避免超出 Windows 命令行长度限制）
+_BATCH_CHUNK_SIZE = 32
+
 
 def get_pngquant_path() -> Path:
     """获取 pngquant 可执行文件路径"""
@@ -35,6 +39,10 @@ def compress_png(
     Returns:
         (成功, 原始大小, 压缩后大小)
     """
+    if output_path is None:
+        # 覆盖原文件：等同于只含一个文件的批量压缩
+        return compress_pngs_batch([input_path], quality_min, quality_max)[0]
+    
     pngquant_path = get_pngquant_path()
     
     if not pngquant_path.exists():
@@ -49,24 +57,13 @@ def compress_png(
     # 构建命令
     quality_arg = f"--quality={quality_min}-{quality_max}"
     
-    if output_path is None:
-        # 覆盖原文件
-        output_path = input_path
-        cmd = [
-            str(pngquant_path),
-            quality_arg,
-            "--force",
-            "--ext", ".png",
-            str(input_path)
-        ]
-    else:
-        cmd = [
-            str(pngquant_path),
-            quality_arg,
-            "--force",
-            "-o", str(output_path),
-            str(input_path)
-        ]
+    cmd = [
+        str(pngquant_path),
+        quality_arg,
+        "--force",
+        "-o", str(output_path),
+        str(input_path)
+    ]
     
     try:
         result = subprocess.run(
@@ -86,6 +83,95 @@ def compress_png(
         return (False, original_size, original_size)
 
 
+def _compress_chunk(
+    pngquant_path: Path,
+    paths: List[Path],
+    quality_min: int,
+    quality_max: int
+) -> List[Tuple[bool, int, int]]:
+    """一次 pngquant 调用原地压缩多个文件"""
+    # 记录原始大小和修改时间，用于判断每个文件是否被重写
+    before = [(path.stat().st_size, path.stat().st_mtime_ns) for path in paths]
+    cmd = [
+        str(pngquant_path),
+        f"--quality={quality_min}-{quality_max}",
+        "--force",
+        "--ext", ".png",
+        *[str(path) for path in paths]
+    ]
+    
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=30 * len(paths)
+        )
+        batch_ok = result.returncode in (0, 99)
+    except (subprocess.TimeoutExpired, Exception):
+        batch_ok = False
+    
+    results = []
+    for path, (original_size, mtime_ns) in zip(paths, before):
+        try:
+            stat = path.stat()
+        except OSError:
+            results.append((False, original_size, original_size))
+            continue
+        # 批量调用只有一个返回码；部分文件失败时，被重写过的文件仍算成功
+        if batch_ok or stat.st_mtime_ns != mtime_ns:
+            results.append((True, original_size, stat.st_size))
+        else:
+            results.append((False, original_size, original_size))
+    return results
+
+
+def compress_pngs_batch(
+    paths: List[Path],
+    quality_min: int = 60,
+    quality_max: int = 80
+) -> List[Tuple[bool, int, int]]:
+    """
+    批量原地压缩 PNG 文件
+    
+    每次 pngquant 调用处理多个文件以摊薄进程启动开销，各批次在线程中并行运行。
+    
+    Args:
+        paths: 要压缩的文件路径列表（覆盖原文件）
+        quality_min: 最低质量 (0-100)
+        quality_max: 最高质量 (0-100)
+    
+    Returns:
+        与 paths 一一对应的 (成功, 原始大小, 压缩后大小) 列表
+    """
+    pngquant_path = get_pngquant_path()
+    results: List[Tuple[bool, int, int]] = [(False, 0, 0)] * len(paths)
+    
+    if not pngquant_path.exists():
+        return results
+    
+    existing = [i for i, path in enumerate(paths) if path.exists()]
+    if not existing:
+        return results
+    
+    # 按 CPU 核数切分批次，文件较少时也能并行
+    workers = min(os.cpu_count() or 1, len(existing))
+    chunk_size = min(_BATCH_CHUNK_SIZE, -(-len(existing) // workers))
+    chunks = [existing[i:i + chunk_size] for i in range(0, len(existing), chunk_size)]
+    
+    # 子进程等待期间不占用 GIL，线程池即可并行
+    with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = [
+            executor.submit(
+                _compress_chunk, pngquant_path, [paths[i] for i in chunk], quality_min, quality_max
+            )
+            for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            for i, result in zip(chunk, future.result()):
+                results[i] = result
+    return results
+
+
 def format_file_size(size_bytes: int) -> str:
     """格式化文件大小为可读字符串"""
     if size_bytes < 1024:
@@ -4,6 +4,7 @@ from PySide6.QtCore import QThread, Signal
 import numpy as np
 
 from src.core.background_remover import BackgroundRemover, BackgroundMode
+from src.workers.signal_batcher import ResultBatcher, StatusThrottle
 
 
 class BackgroundWorker(QThread):
@@ -11,7 +12,7 @@ class BackgroundWorker(QThread):
     
     # 信号
     progress = Signal(int, int, float)  # current, total, percent
-    frame_processed = Signal(int, object)  # frame_index, processed_image
+    frames_processed_batch = Signal(list)  # List[(frame_index, processed_image)]
     status_changed = Signal(str)  # 状态信息
     finished = Signal()
     error = Signal(str)
@@ -31,6 +32,13 @@ class BackgroundWorker(QThread):
         self.ai_params = ai_params
         # 不在这里创建，在run中创建以确保在工作线程中初始化
         self._remover = None
+        self._done = 0
+    
+    def _emit_batch(self, batch: list):
+        """发送一批结果，并附带批次末尾的进度"""
+        self.frames_processed_batch.emit(batch)
+        total = len(self.frames)
+        self.progress.emit(self._done, total, self._done / total * 100)
     
     def _on_remover_progress(self, message: str):
         """接收BackgroundRemover的进度消息"""
@@ -48,28 +56,30 @@ class BackgroundWorker(QThread):
                 model_name = self.ai_params.get('model', 'u2net') if self.ai_params else 'u2net'
                 self.status_changed.emit(f"正在初始化AI模型 ({model_name})...")
             
-            for i, (frame_index, image) in enumerate(self.frames):
-                if self.isInterruptionRequested():
-                    break
-                
-                # 处理单帧
-                result = self._remover.remove_background(
-                    image=image,
-                    mode=self.mode,
-                    color_params=self.color_params,
-                    ai_params=self.ai_params
-                )
-                
-                # 复制结果以确保线程安全
-                result_copy = result.copy()
-                
-                # 发送处理结果
-                self.frame_processed.emit(frame_index, result_copy)
-                
-                # 更新进度
-                progress = (i + 1) / total * 100
-                self.progress.emit(i + 1, total, progress)
-                self.status_changed.emit(f"正在去除背景... {i + 1}/{total}")
+            # 结果按批发送，状态文本最多 10Hz
+            batcher = ResultBatcher(self._emit_batch)
+            status = StatusThrottle(self.status_changed.emit)
+            try:
+                for i, (frame_index, image) in enumerate(self.frames):
+                    if self.isInterruptionRequested():
+                        break
+                    
+                    # 处理单帧
+                    result = self._remover.remove_background(
+                        image=image,
+                        mode=self.mode,
+                        color_params=self.color_params,
+                        ai_params=self.ai_params
+                    )
+                    
+                    # 复制结果以确保线程安全
+                    self._done = i + 1
+                    batcher.add((frame_index, result.copy()))
+                    status(f"正在去除背景... {i + 1}/{total}")
+            finally:
+                # 出错或取消时也把已完成的帧交给界面
+                batcher.flush()
+                status.flush()
             
             self.finished.emit()
         except Exception as e:
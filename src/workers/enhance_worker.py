@@ -4,6 +4,7 @@ from PySide6.QtCore import QThread, Signal
 import numpy as np
 
 from src.core.realesrgan_processor import RealESRGANProcessor
+from src.workers.signal_batcher import ResultBatcher, StatusThrottle
 
 
 class EnhanceWorker(QThread):
@@ -11,11 +12,13 @@ class EnhanceWorker(QThread):
     
     # 信号
     progress = Signal(int, int, float)  # current, total, percent
-    frame_processed = Signal(int, object)  # frame_index, enhanced_image
+    frames_processed_batch = Signal(list)  # List[(frame_index, enhanced_image)]
     status_changed = Signal(str)  # 状态信息
     finished = Signal()
     error = Signal(str)
     
+    BATCH_SIZE = 8  # 每次调用 Real-ESRGAN 处理的帧数
+    
     def __init__(
         self,
         frames: List[tuple],  # List[(frame_index, image)]
@@ -29,6 +32,13 @@ class EnhanceWorker(QThread):
         self.tile = tile
         # 不在这里创建，在run中创建以确保在工作线程中初始化
         self._processor = None
+        self._done = 0
+    
+    def _emit_batch(self, batch: list):
+        """发送一批结果，并附带批次末尾的进度"""
+        self.frames_processed_batch.emit(batch)
+        total = len(self.frames)
+        self.progress.emit(self._done, total, self._done / total * 100)
     
     def _on_processor_progress(self, message: str):
         """接收RealESRGANProcessor的进度消息"""
@@ -44,31 +54,38 @@ class EnhanceWorker(QThread):
             # 发送初始化提示
             self.status_changed.emit(f"正在初始化Real-ESRGAN...")
             
-            for i, (frame_index, image) in enumerate(self.frames):
-                if self.isInterruptionRequested():
-                    break
-                
-                # 发送当前处理的帧信息
-                self.status_changed.emit(f"正在处理第 {i + 1}/{total} 帧...")
-                
-                # 处理单帧
-                result = self._processor.process_image(
-                    image=image,
-                    model_name=self.model_name,
-                    tile=self.tile
-                )
-                
-                if result is not None:
-                    # 复制结果以确保线程安全
-                    result_copy = result.copy()
+            # 结果按批发送，逐帧状态文本最多 10Hz
+            batcher = ResultBatcher(self._emit_batch)
+            status = StatusThrottle(self.status_changed.emit)
+            try:
+                # 按小批量处理：每批只启动一次 Real-ESRGAN 进程、加载一次模型
+                for start in range(0, total, self.BATCH_SIZE):
+                    if self.isInterruptionRequested():
+                        break
+                    
+                    chunk = self.frames[start:start + self.BATCH_SIZE]
+                    end = start + len(chunk)
+                    
+                    # 发送当前处理的帧信息
+                    status(f"正在处理第 {start + 1}-{end}/{total} 帧...")
+                    
+                    results = self._processor.process_images(
+                        [image for _, image in chunk],
+                        model_name=self.model_name,
+                        tile=self.tile
+                    )
                     
-                    # 发送处理结果
-                    self.frame_processed.emit(frame_index, result_copy)
-                
-                # 更新进度
-                progress = (i + 1) / total * 100
-                self.progress.emit(i + 1, total, progress)
-                self.status_changed.emit(f"已完成第 {i + 1}/{total} 帧")
+                    # 结果为新读取的数组，不与其他线程共享，无需复制
+                    self._done = end
+                    for (frame_index, _), result in zip(chunk, results):
+                        if result is not None:
+                            batcher.add((frame_index, result))
+                    batcher.flush()
+                    status(f"已完成第 {end}/{total} 帧")
+            finally:
+                # 出错或取消时也把已完成的帧交给界面
+                batcher.flush()
+                status.flush()
             
             self.status_changed.emit("所有帧处理完成")
             self.finished.emit()
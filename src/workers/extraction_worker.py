@@ -33,7 +33,7 @@ class ExtractionWorker(QThread):
     
     def run(self):
         try:
-            frames = self._extractor.extract_frames(
+            frames = self._extractor.extract_frames_parallel(
                 video_path=self.video_path,
                 start_time=self.start_time,
                 end_time=self.end_time,
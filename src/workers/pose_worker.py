@@ -1,9 +1,27 @@
 """姿势识别工作线程"""
-from typing import List, Tuple
+from typing import List, Tuple, Optional
 from PySide6.QtCore import QThread, Signal
 import numpy as np
+import atexit
+import threading
 
 from src.core.pose_detector import PoseDetector
+from src.workers.signal_batcher import ResultBatcher
+
+
+# 各次检测共享同一个检测器，MediaPipe/RTM 模型加载一次后常驻，程序退出时释放
+_shared_detector: Optional[PoseDetector] = None
+_shared_detector_lock = threading.Lock()
+
+
+def _get_shared_detector() -> PoseDetector:
+    """获取(必要时创建)共享的姿势检测器"""
+    global _shared_detector
+    with _shared_detector_lock:
+        if _shared_detector is None:
+            _shared_detector = PoseDetector()
+            atexit.register(_shared_detector.release)
+        return _shared_detector
 
 
 class PoseWorker(QThread):
@@ -11,7 +29,7 @@ class PoseWorker(QThread):
     
     # 信号
     progress = Signal(int, int, float)  # current, total, percent
-    pose_detected = Signal(int, object)  # frame_index, PoseData/ContourData/RegionalFeatureData
+    frames_processed_batch = Signal(list)  # List[(frame_index, PoseData/ContourData/RegionalFeatureData)]
     finished = Signal()
     error = Signal(str)
     
@@ -24,40 +42,44 @@ class PoseWorker(QThread):
         super().__init__(parent)
         self.frames = frames
         self.mode = mode
-        self._detector = PoseDetector()
+        self._detector = _get_shared_detector()
+        self._done = 0
+    
+    def _emit_batch(self, batch: list):
+        """发送一批检测结果，并附带批次末尾的进度"""
+        self.frames_processed_batch.emit(batch)
+        total = len(self.frames)
+        self.progress.emit(self._done, total, self._done / total * 100)
     
     def run(self):
         try:
-            total = len(self.frames)
-            
-            for i, (frame_index, image) in enumerate(self.frames):
-                if self.isInterruptionRequested():
-                    break
-                
-                # 根据模式选择检测方法
-                if self.mode == "contour":
-                    result = self._detector.extract_contour(image, frame_index)
-                elif self.mode == "image":
-                    result = self._detector.extract_image_features(image, frame_index)
-                elif self.mode == "regional":
-                    result = self._detector.extract_regional_features(image, frame_index)
-                elif self.mode == "pose_rtm":
-                    result = self._detector.detect_pose_rtm(image, frame_index)
-                else:
-                    result = self._detector.detect_pose(image, frame_index)
-                
-                # 发送检测结果
-                self.pose_detected.emit(frame_index, result)
-                
-                # 更新进度
-                progress = (i + 1) / total * 100
-                self.progress.emit(i + 1, total, progress)
+            # 检测结果按批发送
+            batcher = ResultBatcher(self._emit_batch)
+            try:
+                for i, (frame_index, image) in enumerate(self.frames):
+                    if self.isInterruptionRequested():
+                        break
+                    
+                    # 根据模式选择检测方法
+                    if self.mode == "contour":
+                        result = self._detector.extract_contour(image, frame_index)
+                    elif self.mode == "image":
+                        result = self._detector.extract_image_features(image, frame_index)
+                    elif self.mode == "regional":
+                        result = self._detector.extract_regional_features(image, frame_index)
+                    elif self.mode == "pose_rtm":
+                        result = self._detector.detect_pose_rtm(image, frame_index)
+                    else:
+                        result = self._detector.detect_pose(image, frame_index)
+                    
+                    self._done = i + 1
+                    batcher.add((frame_index, result))
+            finally:
+                batcher.flush()
             
             self.finished.emit()
         except Exception as e:
             self.error.emit(str(e))
-        finally:
-            self._detector.release()
     
     def cancel(self):
         """取消检测"""
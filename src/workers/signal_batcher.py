@@ -0,0 +1,65 @@
+"""工作线程信号合并工具
+
+跨线程 emit 每次都要经过排队投递和事件循环分发，逐帧发送时开销可观，
+这里把结果按数量/时间合并成批次，状态文本按频率节流。
+"""
+import time
+from typing import Any, Callable, List, Optional
+
+
+class ResultBatcher:
+    """按数量或时间间隔合并逐帧结果，凑够一批后一次性发送"""
+    
+    def __init__(
+        self,
+        emit: Callable[[List[Any]], None],
+        max_items: int = 8,
+        interval: float = 0.05
+    ):
+        self._emit = emit
+        self._max_items = max_items
+        self._interval = interval
+        self._batch: List[Any] = []
+        self._last_flush = time.monotonic()
+    
+    def add(self, item: Any) -> bool:
+        """加入一个结果，达到批量或超时则发送，返回是否已发送"""
+        self._batch.append(item)
+        if len(self._batch) >= self._max_items or time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+            return True
+        return False
+    
+    def flush(self):
+        """发送尚未发出的结果"""
+        self._last_flush = time.monotonic()
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        self._emit(batch)
+
+
+class StatusThrottle:
+    """限制状态文本的发送频率，被跳过的最后一条在 flush 时补发"""
+    
+    def __init__(self, emit: Callable[[str], None], interval: float = 0.1):
+        self._emit = emit
+        self._interval = interval
+        self._pending: Optional[str] = None
+        self._last_emit = float('-inf')
+    
+    def __call__(self, message: str):
+        now = time.monotonic()
+        if now - self._last_emit >= self._interval:
+            self._last_emit = now
+            self._pending = None
+            self._emit(message)
+        else:
+            self._pending = message
+    
+    def flush(self):
+        """补发被节流掉的最后一条状态"""
+        if self._pending is not None:
+            message, self._pending = self._pending, None
+            self._last_emit = time.monotonic()
+            self._emit(message)
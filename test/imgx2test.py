@@ -1,21 +1,56 @@
 import numpy as np
 import onnxruntime as ort
-from PIL import Image
+import cv2
 import time
+from pathlib import Path
 
 # -------------------------- 配置项（只需改这3个路径/参数） --------------------------
-MODEL_PATH = r"../models/sharp/2x-AnimeSharpV2_ESRGAN_Soft_fp16.onnx"  # 你的模型路径
+MODEL_PATH = r"../models/sharp/2x-AnimeSharpV2_ESRGAN_Soft_fp16.onnx"  # 你的模型路径（也可用 prepack_model.py 生成的 _prepacked.onnx）
 INPUT_IMG = "test.png"  # 输入图片
 OUTPUT_IMG = "upscaled_clear.png"  # 输出清晰图
+TILE = 256  # 分块边长（输入像素），越小越省显存
+TILE_PAD = 16  # 每块四周多取的重叠像素，推理后裁掉，避免拼接缝
+TILE_BATCH = 4  # 每次推理打包的块数，0 表示所有块一次推理完（显存够时GPU占用最高）
 # -----------------------------------------------------------------------------------
 
 # 1. 加载模型 + 强制优先用GPU（CPU模式会自动兜底）
-# 关闭fp16优化，避免兼容性问题
 ort.set_default_logger_severity(3)  # 关闭冗余日志
+# 先查本机实际可用的设备，只把装好的 provider 交给ORT，CPU环境不再先探测CUDA再回退
+available_providers = ort.get_available_providers()
+has_cuda = 'CUDAExecutionProvider' in available_providers
+# 没有CUDA时，如果已用 quantize_model.py 生成了INT8模型就改用它（CPU上INT8卷积快得多）
+if not has_cuda:
+    int8_path = Path(MODEL_PATH).with_name(Path(MODEL_PATH).stem.replace("_fp16", "") + "_int8.onnx")
+    if int8_path.exists():
+        MODEL_PATH = str(int8_path)
+        print(f"✅ 未检测到CUDA，改用INT8模型: {MODEL_PATH}")
+sess_options = ort.SessionOptions()
+sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL  # 开启全部图优化（算子融合等）
+sess_options.enable_cpu_mem_arena = not has_cuda  # 在GPU上跑时张量都在显存，不预留CPU内存池
+sess_options.enable_mem_pattern = True  # 分块后每批形状固定，复用规划好的内存分配
+sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+providers = []
+if has_cuda:
+    providers.append(('CUDAExecutionProvider', {
+        'device_id': 0,  # GPU设备ID（单卡默认0）
+        'arena_extend_strategy': 'kNextPowerOfTwo',
+        'cudnn_conv_algo_search': 'DEFAULT',  # 跳过每种输入尺寸的卷积算法穷举，避免首轮推理极慢
+        'do_copy_in_default_stream': True,
+    }))
+providers.append('CPUExecutionProvider')
+# 装了TensorRT时优先用：卷积融合+FP16内核自动调优，分块后输入形状固定，
+# 构建好的引擎缓存到磁盘，之后启动不用重新构建
+if 'TensorrtExecutionProvider' in available_providers:
+    providers.insert(0, ('TensorrtExecutionProvider', {
+        'device_id': 0,
+        'trt_fp16_enable': True,
+        'trt_engine_cache_enable': True,
+        'trt_engine_cache_path': './trt_cache',
+    }))
 session = ort.InferenceSession(
     MODEL_PATH,
-    providers=['CUDAExecutionProvider', 'CPUExecutionProvider'],
-    provider_options=[{'device_id': 0}]  # GPU设备ID（单卡默认0）
+    sess_options=sess_options,
+    providers=providers
 )
 
 # 2. 【关键】自动获取模型的真实输入节点名（再也不用猜input/x/input_0了）
@@ -25,6 +60,10 @@ INPUT_SHAPE = input_meta.shape  # 模型输入形状（比如[1,3,H,W]）
 INPUT_DTYPE = input_meta.type  # 模型输入类型（大概率是tensor(float)，即float32）
 print(f"✅ 模型真实输入信息：")
 print(f"   张量名: {INPUT_NAME}, 形状: {INPUT_SHAPE}, 数据类型: {INPUT_DTYPE}")
+# 按模型真实输入类型喂数据：fp16模型直接喂float16，免得ORT在边界插Cast节点、多传一倍数据
+INPUT_NP_DTYPE = {'tensor(float)': np.float32, 'tensor(float16)': np.float16, 'tensor(uint8)': np.uint8}[INPUT_DTYPE]
+# prepack_model.py 生成的模型直接接收 uint8 NHWC，转置和类型转换都在模型里（GPU上）完成
+NHWC_INPUT = INPUT_DTYPE == 'tensor(uint8)'
 
 # 检查实际运行的设备
 actual_providers = session.get_providers()
@@ -33,35 +72,106 @@ if 'CUDAExecutionProvider' not in actual_providers:
     print("⚠️ 警告: GPU未启用，使用CPU处理（速度较慢，建议安装CUDA+cuDNN）")
 
 # 3. 读取图片 + 预处理（严格匹配模型要求）
-img = Image.open(INPUT_IMG).convert("RGB")  # 强制RGB，避免透明通道干扰
-img_h, img_w = img.size[1], img.size[0]
-print(f"\n✅ 输入图片尺寸: {img.size} (W×H)")
-
-# 预处理核心：HWC(RGB) → CHW → 加batch维度 → 保持float32（不转fp16、不归一化！）
-# 原因：AnimeSharpV2要求输入是[0,255]的float32原始像素值
-arr = np.array(img, dtype=np.float32)  # 形状：(H, W, 3)，值范围[0,255]
-arr = arr.transpose(2, 0, 1)  # HWC → CHW，形状：(3, H, W)
-arr = np.expand_dims(arr, axis=0)  # 加batch维度，形状：(1, 3, H, W)
+# OpenCV解码直接得到连续的uint8数组（SIMD加速），IMREAD_COLOR 丢弃透明通道避免干扰
+img = cv2.cvtColor(cv2.imread(INPUT_IMG, cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB)  # 模型要求RGB
+img_h, img_w = img.shape[:2]
+print(f"\n✅ 输入图片尺寸: ({img_w}, {img_h}) (W×H)")
+
+# 预处理核心：HWC(RGB) → CHW → 加batch维度 → 转成模型输入类型（不归一化！）
+# 原因：AnimeSharpV2要求输入是[0,255]的原始像素值
+def preprocess(img):
+    """HWC(uint8) → 连续的 (1, 3, H, W) 模型输入类型（float32/float16）
+
+    先在uint8上做一次连续化的转置（transpose本身只改步长，ORT内部仍会再拷一次），
+    再转浮点，临时内存峰值只有原来的一半；预打包模型则原样加batch维度 (1, H, W, 3)
+    """
+    a = np.asarray(img)  # 形状：(H, W, 3)，uint8
+    if NHWC_INPUT:
+        return np.ascontiguousarray(a)[None]
+    a = np.ascontiguousarray(a.transpose(2, 0, 1))[None]  # HWC → CHW + batch维度，形状：(1, 3, H, W)
+    return a.astype(INPUT_NP_DTYPE, copy=False)
+
+
+arr = preprocess(img)
 print(f"✅ 输入张量形状: {arr.shape}, 数据类型: {arr.dtype}, 值范围: [{arr.min():.0f}, {arr.max():.0f}]")
 
 # 4. 模型推理（用自动获取的INPUT_NAME，而非硬编码的input）
-print(f"\n🚀 开始超分推理...")
+use_iobinding = 'CUDAExecutionProvider' in actual_providers
+
+
+def run_model(batch):
+    """推理一个 (N, 3, h, w)（预打包模型为 (N, h, w, 3)）批次，返回 (N, 3, h×倍率, w×倍率)"""
+    # 关键：输入张量名必须是模型真实的INPUT_NAME
+    if use_iobinding:
+        # IOBinding：输入直接放到显存、输出留在显存，省去ORT内部的主机↔显存拷贝节点
+        io_binding = session.io_binding()
+        input_tensor = ort.OrtValue.ortvalue_from_numpy(batch, 'cuda', 0)
+        io_binding.bind_ortvalue_input(INPUT_NAME, input_tensor)
+        io_binding.bind_output(session.get_outputs()[0].name, 'cuda', 0)
+        session.run_with_iobinding(io_binding)
+        return io_binding.get_outputs()[0].numpy()  # 每批只取回一次结果
+    return session.run(None, {INPUT_NAME: batch})[0]
+
+
+# 分块推理：大图整张送入会占满显存，这里切成带重叠边的等大块，按批打包推理后拼回
+# 右/下边缘先补齐到块的整数倍，保证每块尺寸一致、能堆成一个批次
+tile_h, tile_w = min(TILE, img_h), min(TILE, img_w)
+rows, cols = -(-img_h // tile_h), -(-img_w // tile_w)
+h_axis = 1 if NHWC_INPUT else 2  # 输入张量中高度所在的维度，宽度紧随其后
+pad_width = [(0, 0)] * 4
+pad_width[h_axis] = (TILE_PAD, rows * tile_h - img_h + TILE_PAD)
+pad_width[h_axis + 1] = (TILE_PAD, cols * tile_w - img_w + TILE_PAD)
+padded = np.pad(arr, pad_width, mode='edge')
+
+
+def cut_tile(y, x):
+    """取出左上角在 (y, x) 的一块（含四周重叠边）"""
+    ys = slice(y, y + tile_h + 2 * TILE_PAD)
+    xs = slice(x, x + tile_w + 2 * TILE_PAD)
+    return padded[:, ys, xs, :] if NHWC_INPUT else padded[:, :, ys, xs]
+
+
+positions = [(r * tile_h, c * tile_w) for r in range(rows) for c in range(cols)]
+batch_size = TILE_BATCH if TILE_BATCH > 0 else len(positions)
+print(f"\n🚀 开始超分推理（{len(positions)} 块，每块 {tile_w}×{tile_h}，每批 {batch_size} 块）...")
+# 预热：先用同形状的全零批次跑一次，cuDNN卷积算法选择、TRT引擎构建等一次性开销不计入推理耗时
+warmup_start = time.time()
+run_model(np.zeros((min(batch_size, len(positions)),) + cut_tile(0, 0).shape[1:], dtype=padded.dtype))
+print(f"✅ 预热完成，耗时: {time.time() - warmup_start:.2f} 秒")
 start_time = time.time()
-# 关键：输入字典的key必须是模型真实的INPUT_NAME
-output = session.run(None, {INPUT_NAME: arr})[0]
+canvas = None  # 预分配的输出画布 (3, 倍率×H, 倍率×W)，拿到首批结果确定倍率后创建
+for i in range(0, len(positions), batch_size):
+    chunk = positions[i:i + batch_size]
+    batch = np.concatenate([cut_tile(y, x) for y, x in chunk])
+    out = run_model(batch)
+    if canvas is None:
+        # 倍率确定后，输出侧的块尺寸、重叠边和最终尺寸只算一次
+        scale = out.shape[2] // (tile_h + 2 * TILE_PAD)
+        out_tile_h, out_tile_w, out_pad = tile_h * scale, tile_w * scale, TILE_PAD * scale
+        out_h, out_w = img_h * scale, img_w * scale
+        canvas = np.empty((3, rows * out_tile_h, cols * out_tile_w), dtype=out.dtype)
+    for (y, x), tile_out in zip(chunk, out):
+        # 裁掉重叠边，只保留块中心部分
+        oy, ox = y * scale, x * scale
+        canvas[:, oy:oy + out_tile_h, ox:ox + out_tile_w] = \
+            tile_out[:, out_pad:out_pad + out_tile_h, out_pad:out_pad + out_tile_w]
 elapsed = time.time() - start_time
 print(f"✅ 推理完成，耗时: {elapsed:.2f} 秒")
-print(f"✅ 输出张量形状: {output.shape}")
+print(f"✅ 输出张量形状: {canvas.shape}")
 
 # 5. 后处理 + 保存图片（逆预处理，严格防像素值溢出）
-output = output[0]  # 去掉batch维度，形状：(3, 2H, 2W)
-output = output.transpose(1, 2, 0)  # CHW → HWC，形状：(2H, 2W, 3)
-# 核心：裁剪到严格2倍尺寸（避免模型边缘补零）+ 防溢出 + 转uint8
-output = output[:img_h*2, :img_w*2, :]  # 裁剪到输入的2倍，避免多余像素
-output = np.clip(output, 0, 255).astype(np.uint8)  # 强制像素值在[0,255]，避免花屏
-
-# 保存高清图（用PIL保存，默认高质量，避免二次压缩）
-result = Image.fromarray(output)
-print(f"\n✅ 输出图片尺寸: {result.size} (W×H)（严格2倍放大）")
-result.save(OUTPUT_IMG, quality=95)  # quality=95 保证高清，不压缩
+output = canvas.transpose(1, 2, 0)  # CHW → HWC，形状：(2H, 2W, 3)
+# 核心：裁剪到严格2倍尺寸（去掉边缘补齐部分）+ 防溢出 + 转uint8
+output = output[:out_h, :out_w, :]  # 裁剪到输入的2倍，避免多余像素
+if output.dtype != np.float32:
+    # fp16模型的输出：numpy的float16运算是软件模拟的，很慢。
+    # 转置裁剪的同时一次性转成连续的float32，后面的裁剪/转换都是线性访问
+    output = output.astype(np.float32, order='C')
+# 原地裁剪到[0,255]（避免花屏），再一次性转成连续的uint8，不再额外分配同尺寸的浮点中间结果
+np.clip(output, 0, 255, out=output)
+output = output.astype(np.uint8, order='C')
+
+# 保存高清图（PNG无损，OpenCV要求BGR顺序）
+print(f"\n✅ 输出图片尺寸: ({out_w}, {out_h}) (W×H)（严格2倍放大）")
+cv2.imwrite(OUTPUT_IMG, cv2.cvtColor(output, cv2.COLOR_RGB2BGR))
 print(f"✅ 高清图已保存到: {OUTPUT_IMG}")
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""把预处理烘焙进ONNX模型：生成直接接收 uint8 NHWC 输入的 _prepacked.onnx
+
+在原输入前插入 Transpose(NHWC→NCHW) + Cast(uint8→模型原输入类型)，
+转置和类型转换随模型一起在GPU上执行，主机到显存只传uint8（float32的1/4）。
+imgx2test.py 会根据输入类型 tensor(uint8) 自动走NHWC路径。
+"""
+import onnx
+from onnx import helper, TensorProto
+from pathlib import Path
+import sys
+
+model_path = r"../models/sharp/2x-AnimeSharpV2_ESRGAN_Soft_fp16.onnx"
+output_path = Path(model_path).with_name(Path(model_path).stem + "_prepacked.onnx")
+
+print(f"处理模型: {model_path}")
+print("=" * 50)
+
+try:
+    model = onnx.load(model_path)
+    graph = model.graph
+    
+    # 真实输入（排除旧版导出时混在 graph.input 里的权重）
+    initializer_names = {init.name for init in graph.initializer}
+    orig_input = next(inp for inp in graph.input if inp.name not in initializer_names)
+    tensor_type = orig_input.type.tensor_type
+    if tensor_type.elem_type == TensorProto.UINT8:
+        print("\n✓ 模型输入已经是 uint8，无需处理")
+        sys.exit(0)
+    
+    # 原形状 [N, 3, H, W] → 新形状 [N, H, W, 3]，保留动态维度名
+    dims = [d.dim_param or (d.dim_value if d.HasField("dim_value") else None)
+            for d in tensor_type.shape.dim]
+    n, c, h, w = dims
+    u8_name = orig_input.name + "_u8"
+    nchw_name = orig_input.name + "_nchw"
+    new_input = helper.make_tensor_value_info(u8_name, TensorProto.UINT8, [n, h, w, c])
+    
+    # 插入的节点输出沿用原输入名，原有节点无需改动
+    transpose = helper.make_node("Transpose", [u8_name], [nchw_name], perm=[0, 3, 1, 2])
+    cast = helper.make_node("Cast", [nchw_name], [orig_input.name], to=tensor_type.elem_type)
+    
+    graph.input.remove(orig_input)
+    graph.input.insert(0, new_input)
+    graph.node.insert(0, cast)
+    graph.node.insert(0, transpose)
+    
+    onnx.checker.check_model(model)
+    onnx.save(model, str(output_path))
+    
+    print(f"\n  原输入: {orig_input.name} {dims} {TensorProto.DataType.Name(tensor_type.elem_type)}")
+    print(f"  新输入: {u8_name} {[n, h, w, c]} UINT8")
+    print(f"\n✓ 已保存到: {output_path}")
+    
+except Exception as e:
+    print(f"\n✗ 处理失败: {e}")
+    sys.exit(1)
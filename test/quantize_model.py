@@ -0,0 +1,108 @@
+"""把超分模型静态量化为 INT8，生成 CPU 推理用的 _int8.onnx
+
+没有CUDA时 imgx2test.py 会自动改用这个模型：INT8 卷积在CPU上比浮点快得多，文件也小很多。
+校准数据取自 CALIB_DIR 里的代表帧（比如从视频里提取的帧），每张取中心的一块。
+"""
+import cv2
+import numpy as np
+import onnx
+from onnx import numpy_helper, AttributeProto, TensorProto
+from onnxruntime.quantization import (
+    quantize_static, CalibrationDataReader, QuantFormat, QuantType
+)
+from onnxruntime.quantization.shape_inference import quant_pre_process
+from pathlib import Path
+import sys
+
+model_path = r"../models/sharp/2x-AnimeSharpV2_ESRGAN_Soft_fp16.onnx"
+CALIB_DIR = "calib"  # 代表帧目录（PNG/JPG）
+CALIB_COUNT = 50  # 最多使用的校准帧数
+CALIB_TILE = 128  # 每帧取中心块的边长，校准只看数值分布，不需要整张图
+
+stem = Path(model_path).stem.replace("_fp16", "")
+fp32_path = Path(model_path).with_name(stem + "_fp32.onnx")
+int8_path = Path(model_path).with_name(stem + "_int8.onnx")
+
+
+def to_float32(model):
+    """fp16 模型转回 fp32（onnxruntime 的量化工具只接受 fp32 模型）"""
+    graph = model.graph
+    for init in graph.initializer:
+        if init.data_type == TensorProto.FLOAT16:
+            init.CopyFrom(numpy_helper.from_array(
+                numpy_helper.to_array(init).astype(np.float32), init.name
+            ))
+    for info in list(graph.input) + list(graph.output) + list(graph.value_info):
+        if info.type.tensor_type.elem_type == TensorProto.FLOAT16:
+            info.type.tensor_type.elem_type = TensorProto.FLOAT
+    for node in graph.node:
+        for attr in node.attribute:
+            if node.op_type == "Cast" and attr.name == "to" and attr.i == TensorProto.FLOAT16:
+                attr.i = TensorProto.FLOAT
+            elif attr.type == AttributeProto.TENSOR and attr.t.data_type == TensorProto.FLOAT16:
+                attr.t.CopyFrom(numpy_helper.from_array(
+                    numpy_helper.to_array(attr.t).astype(np.float32), attr.t.name
+                ))
+    return model
+
+
+class FrameCalibrationReader(CalibrationDataReader):
+    """逐张读取代表帧，按 imgx2test.py 的方式预处理成 (1, 3, h, w) float32"""
+    
+    def __init__(self, input_name, paths):
+        self._input_name = input_name
+        self._paths = iter(paths)
+    
+    def get_next(self):
+        for path in self._paths:
+            img = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if img is None:
+                continue
+            h, w = img.shape[:2]
+            th, tw = min(CALIB_TILE, h), min(CALIB_TILE, w)
+            y, x = (h - th) // 2, (w - tw) // 2
+            rgb = cv2.cvtColor(img[y:y + th, x:x + tw], cv2.COLOR_BGR2RGB)
+            arr = np.ascontiguousarray(rgb.transpose(2, 0, 1))[None].astype(np.float32)
+            return {self._input_name: arr}
+        return None
+
+
+print(f"量化模型: {model_path}")
+print("=" * 50)
+
+try:
+    calib_paths = sorted(
+        p for p in Path(CALIB_DIR).glob("*") if p.suffix.lower() in (".png", ".jpg", ".jpeg")
+    )[:CALIB_COUNT]
+    if not calib_paths:
+        print(f"\n✗ 校准目录 {CALIB_DIR} 中没有图片")
+        sys.exit(1)
+    
+    # 1. 转成 fp32（量化工具的输入要求），再做量化前的形状推断和图优化
+    model = to_float32(onnx.load(model_path))
+    onnx.checker.check_model(model)
+    onnx.save(model, str(fp32_path))
+    quant_pre_process(str(fp32_path), str(fp32_path))
+    initializer_names = {init.name for init in model.graph.initializer}
+    input_name = next(inp.name for inp in model.graph.input if inp.name not in initializer_names)
+    print(f"\n  fp32 中间模型: {fp32_path}")
+    
+    # 2. 用代表帧校准激活值范围后量化：x64 CPU 上 QOperator 格式用 uint8激活 + int8权重 最快
+    print(f"  校准帧数: {len(calib_paths)}（每帧取中心 {CALIB_TILE}×{CALIB_TILE}）")
+    quantize_static(
+        str(fp32_path),
+        str(int8_path),
+        FrameCalibrationReader(input_name, calib_paths),
+        quant_format=QuantFormat.QOperator,
+        activation_type=QuantType.QUInt8,
+        weight_type=QuantType.QInt8,
+    )
+    
+    size_before = Path(model_path).stat().st_size / 1024 / 1024
+    size_after = int8_path.stat().st_size / 1024 / 1024
+    print(f"\n  模型大小: {size_before:.1f} MB → {size_after:.1f} MB")
+    print(f"\n✓ 已保存到: {int8_path}")
+
+except Exception as e:
+    print(f"\n✗ 量化失败: {e}")
+    sys.exit(1)